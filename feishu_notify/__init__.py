@@ -15,13 +15,30 @@ Usage:
     await notifier.send(msg)
 """
 
+import importlib
+
 from .core.types import NotifyLevel, NotifyMessage, LinkButton
-from .core.builder import FeishuCardBuilder
-from .core.sender import FeishuSender
-from .core.dedup import DedupManager, RateLimiter
-from .templates.loader import TemplateLoader
 from .config import NotifyConfig
-from .notifier import Notifier
+
+# 依赖 httpx / jinja2 的组件按需导入（PEP 562），只使用消息模型或配置时不加载
+_LAZY_IMPORTS = {
+    "Notifier": ".notifier",
+    "FeishuCardBuilder": ".core.builder",
+    "FeishuSender": ".core.sender",
+    "DedupManager": ".core.dedup",
+    "RateLimiter": ".core.dedup",
+    "TemplateLoader": ".templates.loader",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __version__ = "1.0.0"
 __all__ = [
@@ -4,33 +4,42 @@
 支持通过环境变量、配置文件或代码配置
 """
 
-import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..core import jsonlib
+from ..core.types import _SLOTS
+
 
 # 级别配置文件路径
 LEVELS_CONFIG_PATH = Path(__file__).parent / "levels.json"
 
 
+@lru_cache(maxsize=1)
+def _load_levels_config_cached(path_str: str) -> Dict[str, Any]:
+    """按文件绝对路径缓存解析结果，进程内只读取一次"""
+    try:
+        config = jsonlib.loads(Path(path_str).read_bytes())
+    except FileNotFoundError:
+        return {}
+    # 移除注释字段
+    config.pop("_comment", None)
+    return config
+
+
 def load_levels_config() -> Dict[str, Any]:
-    """加载级别配置"""
-    if LEVELS_CONFIG_PATH.exists():
-        with open(LEVELS_CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
-            # 移除注释字段
-            config.pop("_comment", None)
-            return config
-    return {}
+    """加载级别配置（结果在进程内共享，请勿修改）"""
+    return _load_levels_config_cached(str(LEVELS_CONFIG_PATH.resolve()))
 
 
 # 全局级别配置
 LEVELS_CONFIG = load_levels_config()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NotifyConfig:
     """
     通知工具配置
@@ -55,19 +64,30 @@ class NotifyConfig:
     enable_dedup: bool = True  # 是否启用去重
     dedup_ttl_seconds: int = 300  # 去重 TTL (秒)
     dedup_backend: str = "memory"  # 去重后端: memory | redis
+    dedup_max_entries: int = 10000  # 内存去重最多保留的记录数 (LRU 淘汰)
     
     # 限流配置
     enable_rate_limit: bool = True  # 是否启用限流
     rate_limit_window: int = 60  # 限流窗口 (秒)
     rate_limit_max_count: int = 10  # 窗口内最大消息数
+    rate_limit_backend: str = "memory"  # 限流后端: memory | redis
     
     # 重试配置
     max_retries: int = 3  # 最大重试次数
-    retry_delay: float = 1.0  # 重试延迟 (秒)
+    retry_delay: float = 1.0  # 重试退避基准延迟 (秒)，按指数退避并加随机抖动
+    max_retry_delay: float = 30.0  # 单次重试延迟上限 (秒)
+    circuit_threshold: int = 5  # 连续失败多少次后熔断 (0 不熔断)
+    circuit_cooldown: float = 30.0  # 熔断持续时间 (秒)
     
     # 超时配置
     timeout_seconds: float = 10.0  # HTTP 请求超时
     
+    # 并发配置
+    max_concurrent_requests: int = 5  # 批量发送时的最大并发请求数
+    max_connections: int = 100  # HTTP 连接池最大连接数
+    max_keepalive_connections: int = 20  # HTTP 连接池最多保持的空闲长连接数
+    http2: bool = True  # 是否启用 HTTP/2 (需安装 h2，未安装时使用 HTTP/1.1)
+    
     # 日志配置
     enable_logging: bool = True  # 是否启用日志
     log_level: str = "INFO"  # 日志级别
@@ -106,7 +126,9 @@ class NotifyConfig:
     @classmethod
     def from_dict(cls, config_dict: Dict) -> "NotifyConfig":
         """从字典创建配置"""
-        return cls(**{k: v for k, v in config_dict.items() if hasattr(cls, k)})
+        # 按字段名过滤（slots 类的属性与 default_factory 字段都不能用 hasattr 判断）
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in config_dict.items() if k in names})
     
     def validate(self) -> bool:
         """验证配置有效性"""
@@ -7,9 +7,15 @@
 
 from typing import Any, Dict, List, Optional
 
+from . import jsonlib
 from .types import NotifyLevel, NotifyMessage
 
 
+# @ 提醒标签
+_AT_ALL = "<at id=all></at>"
+_AT_TEMPLATE = "<at id={}></at>"
+
+
 class FeishuCardBuilder:
     """
     飞书卡片构建器
@@ -18,6 +24,18 @@ class FeishuCardBuilder:
     自动根据消息级别选择颜色、Emoji、布局
     """
     
+    # 卡片 config 固定不变，所有卡片共享同一个对象（只读，请勿修改）
+    _CONFIG: Dict[str, Any] = {
+        "wide_screen_mode": True,
+        "enable_forward": True,
+    }
+    
+    # 上下文字段的内容模板，顺序与 _build_context_fields 中的取值一一对应
+    _FIELD_TEMPLATES = tuple(
+        f"**{label}**\n%s"
+        for label in ("来源系统", "任务名称", "任务ID", "开始时间", "结束时间", "耗时", "时间")
+    )
+    
     def __init__(self, message: NotifyMessage):
         """
         初始化构建器
@@ -35,120 +53,113 @@ class FeishuCardBuilder:
         Returns:
             飞书卡片 JSON 字典
         """
-        card = {
-            "config": {
-                "wide_screen_mode": True,
-                "enable_forward": True,
-            },
-            "header": self._build_header(),
-            "elements": self._build_elements(),
-        }
-        return card
-    
-    def _build_header(self) -> Dict[str, Any]:
-        """构建卡片头部"""
         return {
-            "template": self.level.color,
-            "title": {
-                "tag": "plain_text",
-                "content": self.message.formatted_title,
+            "config": self._CONFIG,
+            "header": {
+                "template": self.level.color,
+                "title": {
+                    "tag": "plain_text",
+                    "content": self.message.formatted_title,
+                },
             },
+            "elements": self._build_elements(),
         }
     
     def _build_elements(self) -> List[Dict[str, Any]]:
         """构建卡片主体元素"""
-        elements = []
+        message = self.message
+        elements: List[Dict[str, Any]] = []
+        append = elements.append
         
         # 1. 主要内容
-        if self.message.content:
-            elements.append({
+        if message.content:
+            append({
                 "tag": "markdown",
-                "content": self.message.content,
+                "content": message.content,
             })
         
         # 2. 上下文信息字段
         context_fields = self._build_context_fields()
         if context_fields:
-            elements.append({
+            append({
                 "tag": "div",
                 "fields": context_fields,
             })
         
         # 3. 错误信息
-        if self.message.error_msg:
-            elements.append({"tag": "hr"})
-            error_content = f"**错误信息**\n```\n{self.message.error_msg}\n```"
-            if self.message.error_code:
-                error_content = f"**错误代码** `{self.message.error_code}`\n\n" + error_content
-            elements.append({
+        if message.error_msg:
+            append({"tag": "hr"})
+            error_content = f"**错误信息**\n```\n{message.error_msg}\n```"
+            if message.error_code:
+                error_content = f"**错误代码** `{message.error_code}`\n\n" + error_content
+            append({
                 "tag": "markdown",
                 "content": error_content,
             })
         
         # 4. 指标数据
-        if self.message.metrics:
+        if message.metrics:
             metrics_content = self._format_metrics()
             if metrics_content:
-                elements.append({
+                append({
                     "tag": "markdown",
                     "content": metrics_content,
                 })
         
         # 5. 扩展字段
-        if self.message.extra:
+        if message.extra:
             extra_fields = self._build_extra_fields()
             if extra_fields:
-                elements.append({
+                append({
                     "tag": "div",
                     "fields": extra_fields,
                 })
         
         # 6. 分割线
-        if self.message.links or self.message.mentions or self.message.mention_all:
-            elements.append({"tag": "hr"})
+        if message.links or message.mentions or message.mention_all:
+            append({"tag": "hr"})
         
         # 7. 操作按钮
-        if self.message.links:
-            elements.append(self._build_actions())
+        if message.links:
+            append(self._build_actions())
         
         # 8. @ 提醒
         at_content = self._build_at_content()
         if at_content:
-            elements.append({
+            append({
                 "tag": "markdown",
                 "content": at_content,
             })
         
         # 9. 底部备注
-        elements.append(self._build_note())
+        append(self._build_note())
         
         return elements
     
     def _build_context_fields(self) -> List[Dict[str, Any]]:
         """构建上下文字段"""
-        fields = []
+        message = self.message
+        values = (
+            message.source,
+            message.task_name,
+            message.task_id,
+            message.start_time,
+            message.end_time,
+            message.duration,
+            message.formatted_timestamp if not message.start_time else None,
+        )
         
-        field_mapping = [
-            ("来源系统", self.message.source),
-            ("任务名称", self.message.task_name),
-            ("任务ID", self.message.task_id),
-            ("开始时间", self.message.start_time),
-            ("结束时间", self.message.end_time),
-            ("耗时", self.message.duration),
-            ("时间", self.message.formatted_timestamp if not self.message.start_time else None),
+        return [
+            {
+                "is_short": True,
+                "text": {
+                    "tag": "lark_md",
+                    "content": template % (value,),
+                },
+            }
+            for template, value in zip(self._FIELD_TEMPLATES, values)
+            if value
         ]
-        
-        for label, value in field_mapping:
-            if value:
-                fields.append({
-                    "is_short": True,
-                    "text": {
-                        "tag": "lark_md",
-                        "content": f"**{label}**\n{value}",
-                    },
-                })
-        
-        return fields
     
     def _format_metrics(self) -> Optional[str]:
         """格式化指标数据"""
@@ -185,14 +196,14 @@ class FeishuCardBuilder:
     def _build_actions(self) -> Dict[str, Any]:
         """构建操作按钮"""
         actions = []
+        has_primary = False
         
         for link in self.message.links:
             button_type = "danger" if link.is_danger else "default"
             # 第一个非危险按钮设为 primary
-            if not link.is_danger and not any(
-                a.get("type") == "primary" for a in actions
-            ):
+            if not link.is_danger and not has_primary:
                 button_type = "primary"
+                has_primary = True
             
             actions.append({
                 "tag": "button",
@@ -211,23 +222,17 @@ class FeishuCardBuilder:
     
     def _build_at_content(self) -> Optional[str]:
         """构建 @ 提醒内容"""
-        at_parts = []
-        
-        if self.message.mention_all:
-            at_parts.append("<at id=all></at>")
-        
-        for user_id in self.message.mentions:
-            at_parts.append(f"<at id={user_id}></at>")
-        
-        if at_parts:
-            return " ".join(at_parts)
-        return None
+        message = self.message
+        at_parts = [_AT_ALL] if message.mention_all else []
+        at_parts.extend(map(_AT_TEMPLATE.format, message.mentions))
+        return " ".join(at_parts) or None
     
     def _build_note(self) -> Dict[str, Any]:
         """构建底部备注"""
-        note_text = f"来自 {self.message.source}"
-        if self.message.dedupe_key:
-            note_text += f" | ID: {self.message.dedupe_key}"
+        message = self.message
+        note_text = f"来自 {message.source}"
+        if message.dedupe_key:
+            note_text += f" | ID: {message.dedupe_key}"
         
         return {
             "tag": "note",
@@ -250,6 +255,15 @@ class FeishuCardBuilder:
             "msg_type": "interactive",
             "card": self.build(),
         }
+    
+    def to_webhook_bytes(self) -> bytes:
+        """
+        生成 Webhook 请求体
+        
+        Returns:
+            UTF-8 编码的 payload JSON，可直接作为 HTTP body 发送
+        """
+        return jsonlib.dumps(self.to_webhook_payload())
 
 
 def build_card(message: NotifyMessage) -> Dict[str, Any]:
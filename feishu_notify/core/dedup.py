@@ -8,28 +8,117 @@
 - 可扩展 Redis 后端
 """
 
+import asyncio
 import hashlib
 import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
-from .types import NotifyLevel, NotifyMessage
+from . import jsonlib
+from .types import _SLOTS, NotifyLevel, NotifyMessage
+
+
+def _fingerprint(content: str) -> str:
+    """
+    生成内容指纹（16 位十六进制）
+    
+    仅用于去重比对，不需要密码学强度；BLAKE2b 8 字节摘要比 MD5 截断更快
+    """
+    return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
+def create_redis_client(redis_url: str) -> Any:
+    """
+    创建 Redis 客户端（redis 为可选依赖，使用 Redis 后端时才导入）
+    
+    Raises:
+        ImportError: 未安装 redis
+    """
+    try:
+        import redis
+    except ImportError:
+        raise ImportError(
+            "Redis 后端需要安装 redis: pip install feishu-notify[redis]"
+        ) from None
+    return redis.Redis.from_url(redis_url)
+
+
+@lru_cache(maxsize=1024)
+def _ratelimit_key(source: str, level_name: str) -> str:
+    """限流 key（来源+级别组合有限，缓存后同一组合复用同一字符串）"""
+    return f"ratelimit:{source}:{level_name}"
+
+
+@lru_cache(maxsize=1024)
+def _dedup_key(dedupe_key: str) -> str:
+    """指定 dedupe_key 时的去重 key"""
+    return f"dedup:{dedupe_key}"
+
+
+# 不限流的级别
+_EXEMPT_LEVELS = frozenset((NotifyLevel.CRITICAL, NotifyLevel.ERROR))
+
+def _prune(timestamps: Deque[int], cutoff: int) -> bool:
+    """
+    弹出不晚于 cutoff 的时间戳（时间戳递增，过期的都在队首）
+    
+    Returns:
+        是否仍有未过期的时间戳
+    """
+    while timestamps and timestamps[0] <= cutoff:
+        timestamps.popleft()
+    return bool(timestamps)
+
+
+# DedupManager.mark 的 existing 缺省值：调用方未查询过去重记录
+_UNCHECKED: Any = object()
 
 
-@dataclass
 class DedupRecord:
-    """去重记录"""
-    key: str
-    first_seen: float
-    last_seen: float
-    count: int = 1
-    last_message_hash: str = ""
+    """
+    去重记录
+    
+    每条新消息创建一条记录，使用手写 __slots__ 类，构造开销低于 dataclass
+    """
+    
+    __slots__ = ("key", "first_seen", "last_seen", "count", "last_message_hash")
+    
+    def __init__(
+        self,
+        key: str,
+        first_seen: float,
+        last_seen: float,
+        count: int = 1,
+        last_message_hash: str = "",
+    ):
+        self.key = key
+        self.first_seen = first_seen
+        self.last_seen = last_seen
+        self.count = count
+        self.last_message_hash = last_message_hash
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    def __repr__(self) -> str:
+        fields_repr = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"DedupRecord({fields_repr})"
+    
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None  # 可变记录，与原 dataclass 一致不可哈希
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RateLimitRecord:
     """限流记录"""
     key: str
@@ -54,6 +143,20 @@ class DedupBackend(ABC):
         """删除去重记录"""
         pass
     
+    def set_if_absent(self, key: str, record: DedupRecord, ttl: int) -> bool:
+        """
+        key 不存在（或已过期）时写入记录
+        
+        默认实现为 get + set，不是原子操作；支持原子写入的后端应覆盖此方法
+        
+        Returns:
+            是否写入
+        """
+        if self.get(key) is not None:
+            return False
+        self.set(key, record, ttl)
+        return True
+    
     @abstractmethod
     def cleanup(self) -> int:
         """清理过期记录，返回清理数量"""
@@ -61,26 +164,54 @@ class DedupBackend(ABC):
 
 
 class MemoryDedupBackend(DedupBackend):
-    """内存去重后端"""
+    """
+    内存去重后端
     
-    def __init__(self):
-        self._data: Dict[str, Tuple[DedupRecord, float]] = {}  # key -> (record, expire_time)
-        self._lock = threading.RLock()
+    OrderedDict 按写入顺序保存记录（TTL 相同时即按过期时间排序）:
+    - 超过 max_entries 时淘汰最早写入（最先过期）的记录，内存有上限
+    - 过期检查只在访问时进行，cleanup 从头部弹出已过期记录，无需全量扫描
+    - 过期时间使用 time.monotonic_ns() 整数纳秒，不受系统时间调整影响
+    - 读取不加锁（单次 dict 查找在 GIL 下是原子的），只有修改结构时才持锁
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[DedupRecord, int]]" = OrderedDict()  # key -> (record, expire_ns)
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[DedupRecord]:
-        with self._lock:
-            if key in self._data:
-                record, expire_time = self._data[key]
-                if time.time() < expire_time:
-                    return record
-                else:
-                    del self._data[key]
+        entry = self._data.get(key)
+        if entry is None:
             return None
+        record, expire_ns = entry
+        if time.monotonic_ns() < expire_ns:
+            return record
+        # 已过期：只删除仍是本条的记录，避免误删并发写入的新记录
+        with self._lock:
+            if self._data.get(key) is entry:
+                del self._data[key]
+        return None
     
     def set(self, key: str, record: DedupRecord, ttl: int) -> None:
         with self._lock:
-            expire_time = time.time() + ttl
-            self._data[key] = (record, expire_time)
+            self._store(key, record, time.monotonic_ns() + int(ttl * 1_000_000_000))
+    
+    def set_if_absent(self, key: str, record: DedupRecord, ttl: int) -> bool:
+        with self._lock:
+            now = time.monotonic_ns()
+            entry = self._data.get(key)
+            if entry is not None and now < entry[1]:
+                return False
+            self._store(key, record, now + int(ttl * 1_000_000_000))
+            return True
+    
+    def _store(self, key: str, record: DedupRecord, expire_ns: int) -> None:
+        """写入记录并淘汰超出上限的旧记录（调用方需持有锁）"""
+        data = self._data
+        data[key] = (record, expire_ns)
+        data.move_to_end(key)
+        while len(data) > self.max_entries:
+            data.popitem(last=False)
     
     def delete(self, key: str) -> None:
         with self._lock:
@@ -88,14 +219,131 @@ class MemoryDedupBackend(DedupBackend):
     
     def cleanup(self) -> int:
         with self._lock:
-            now = time.time()
-            expired_keys = [
-                k for k, (_, expire_time) in self._data.items()
-                if now >= expire_time
-            ]
-            for key in expired_keys:
-                del self._data[key]
-            return len(expired_keys)
+            now = time.monotonic_ns()
+            data = self._data
+            count = 0
+            # 记录按过期时间有序，遇到第一条未过期的即可停止
+            while data:
+                _, (_, expire_ns) = next(iter(data.items()))
+                if now < expire_ns:
+                    break
+                data.popitem(last=False)
+                count += 1
+            return count
+
+
+class RedisDedupBackend(DedupBackend):
+    """
+    Redis 去重后端
+    
+    多进程/多机共享去重记录；记录以 JSON 保存，过期由 Redis 的 PX 负责，
+    无需本地清理
+    """
+    
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        client: Any = None,
+        prefix: str = "feishu_notify:",
+    ):
+        """
+        Args:
+            redis_url: Redis URL，client 为 None 时用于创建客户端
+            client: 已有的 redis.Redis 客户端
+            prefix: key 前缀
+        """
+        if client is None:
+            if not redis_url:
+                raise ValueError("redis_url is required for RedisDedupBackend")
+            client = create_redis_client(redis_url)
+        self._client = client
+        self._prefix = prefix
+    
+    def get(self, key: str) -> Optional[DedupRecord]:
+        raw = self._client.get(self._prefix + key)
+        if raw is None:
+            return None
+        return DedupRecord(**jsonlib.loads(raw))
+    
+    def set(self, key: str, record: DedupRecord, ttl: int) -> None:
+        self._client.set(
+            self._prefix + key,
+            jsonlib.dumps(record.to_dict()),
+            px=int(ttl * 1000),
+        )
+    
+    def set_if_absent(self, key: str, record: DedupRecord, ttl: int) -> bool:
+        # SET NX PX：一次往返内原子地判断并写入，多进程同时发送相同消息时只有一个成功
+        return bool(self._client.set(
+            self._prefix + key,
+            jsonlib.dumps(record.to_dict()),
+            nx=True,
+            px=int(ttl * 1000),
+        ))
+    
+    def delete(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+    
+    def cleanup(self) -> int:
+        # 过期由 Redis 处理
+        return 0
+
+
+class _CleanupRegistry:
+    """
+    共享的后台清理调度
+    
+    所有 DedupManager / RateLimiter 实例共用一个守护线程，按各自间隔调用清理方法:
+    - 只持有清理方法的弱引用，实例被回收后自动注销，不会因清理线程而无法释放
+    - 没有存活的任务时线程退出，下次注册时再启动
+    """
+    
+    def __init__(self):
+        # [下次执行时间, 间隔, 清理方法的弱引用]
+        self._tasks: List[list] = []
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+    
+    def register(self, method: Callable[[], Any], interval: float) -> None:
+        """注册清理方法（须为实例的绑定方法）"""
+        with self._cond:
+            self._tasks.append([time.monotonic() + interval, interval, weakref.WeakMethod(method)])
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="feishu-notify-cleanup", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                self._tasks = [task for task in self._tasks if task[2]() is not None]
+                if not self._tasks:
+                    self._thread = None
+                    return
+                
+                due = []
+                for task in self._tasks:
+                    if task[0] <= now:
+                        task[0] = now + task[1]
+                        due.append(task[2])
+                if not due:
+                    self._cond.wait(min(task[0] for task in self._tasks) - now)
+                    continue
+            
+            # 在锁外执行清理，避免阻塞注册
+            for ref in due:
+                method = ref()
+                if method is None:
+                    continue
+                try:
+                    method()
+                except Exception:
+                    pass
+                del method
+
+
+_CLEANUP_REGISTRY = _CleanupRegistry()
 
 
 class DedupManager:
@@ -113,6 +361,7 @@ class DedupManager:
         ttl_seconds: int = 300,
         enable_auto_cleanup: bool = True,
         cleanup_interval: int = 60,
+        max_entries: int = 10000,
     ):
         """
         初始化去重管理器
@@ -122,42 +371,40 @@ class DedupManager:
             ttl_seconds: 去重 TTL（秒）
             enable_auto_cleanup: 是否自动清理过期记录
             cleanup_interval: 清理间隔（秒）
+            max_entries: 内存后端最多保留的记录数
         """
-        self.backend = backend or MemoryDedupBackend()
+        self.backend = backend or MemoryDedupBackend(max_entries=max_entries)
         self.ttl_seconds = ttl_seconds
+        # 保护 mark 中"读取-更新/创建-写回"的复合操作
+        self._mark_lock = threading.Lock()
         
         if enable_auto_cleanup:
             self._start_cleanup_thread(cleanup_interval)
     
     def _start_cleanup_thread(self, interval: int):
-        """启动自动清理线程"""
-        def cleanup_worker():
-            while True:
-                time.sleep(interval)
-                try:
-                    count = self.backend.cleanup()
-                    if count > 0:
-                        pass  # logger.debug(f"Cleaned up {count} expired dedup records")
-                except Exception:
-                    pass
-        
-        thread = threading.Thread(target=cleanup_worker, daemon=True)
-        thread.start()
+        """注册到共享的后台清理线程"""
+        _CLEANUP_REGISTRY.register(self._cleanup, interval)
+    
+    def _cleanup(self) -> None:
+        """清理后端的过期记录"""
+        count = self.backend.cleanup()
+        if count > 0:
+            pass  # logger.debug(f"Cleaned up {count} expired dedup records")
     
     def _generate_key(self, message: NotifyMessage) -> str:
         """生成去重 key"""
         if message.dedupe_key:
-            return f"dedup:{message.dedupe_key}"
+            return _dedup_key(message.dedupe_key)
         
         # 没有指定 dedupe_key，基于消息内容生成
         content = f"{message.level.name}:{message.source}:{message.title}:{message.content}"
-        hash_value = hashlib.md5(content.encode()).hexdigest()[:16]
+        hash_value = _fingerprint(content)
         return f"dedup:auto:{hash_value}"
     
     def _generate_message_hash(self, message: NotifyMessage) -> str:
         """生成消息内容哈希"""
         content = f"{message.title}:{message.content}:{message.error_msg or ''}"
-        return hashlib.md5(content.encode()).hexdigest()[:16]
+        return _fingerprint(content)
     
     def is_duplicate(self, message: NotifyMessage) -> Tuple[bool, Optional[DedupRecord]]:
         """
@@ -176,12 +423,51 @@ class DedupManager:
             return True, record
         return False, None
     
-    def mark(self, message: NotifyMessage) -> DedupRecord:
+    def claim(self, message: NotifyMessage) -> Tuple[bool, Optional[DedupRecord]]:
+        """
+        原子地检查并占用去重记录（发送前调用）
+        
+        记录不存在时写入新记录，相同消息并发（含多进程共享 Redis 后端）时只有一个占用成功；
+        发送失败时应调用 clear 释放
+        
+        Args:
+            message: 消息对象
+            
+        Returns:
+            (是否占用成功, 新记录或已有记录)
+        """
+        key = self._generate_key(message)
+        now = time.time()
+        record = DedupRecord(
+            key=key,
+            first_seen=now,
+            last_seen=now,
+            count=1,
+            last_message_hash=self._generate_message_hash(message),
+        )
+        existing = None
+        # 已有记录可能在两次调用之间过期，此时重新尝试占用
+        for _ in range(3):
+            if self.backend.set_if_absent(key, record, self.ttl_seconds):
+                return True, record
+            existing = self.backend.get(key)
+            if existing is not None:
+                break
+        return False, existing
+    
+    def mark(
+        self,
+        message: NotifyMessage,
+        existing: Optional[DedupRecord] = _UNCHECKED,
+    ) -> DedupRecord:
         """
         标记消息已发送
         
         Args:
             message: 消息对象
+            existing: is_duplicate 已查到的记录（None 表示当时不存在），
+                      传入记录时不再重复查询后端；传入 None 时原子地创建记录，
+                      若已被并发写入则更新已有记录；不传则在此查询
             
         Returns:
             去重记录
@@ -190,25 +476,32 @@ class DedupManager:
         message_hash = self._generate_message_hash(message)
         now = time.time()
         
-        existing = self.backend.get(key)
-        if existing:
+        with self._mark_lock:
+            if existing is _UNCHECKED:
+                existing = self.backend.get(key)
+            if not existing:
+                # 创建新记录：仅在不存在时写入，调用方传入的 None 可能已过时
+                # （其他线程/进程已写入），此时改为更新已有记录，不重置计数
+                record = DedupRecord(
+                    key=key,
+                    first_seen=now,
+                    last_seen=now,
+                    count=1,
+                    last_message_hash=message_hash,
+                )
+                if self.backend.set_if_absent(key, record, self.ttl_seconds):
+                    return record
+                existing = self.backend.get(key)
+                if existing is None:
+                    self.backend.set(key, record, self.ttl_seconds)
+                    return record
+            
             # 更新已有记录
             existing.last_seen = now
             existing.count += 1
             existing.last_message_hash = message_hash
             self.backend.set(key, existing, self.ttl_seconds)
             return existing
-        else:
-            # 创建新记录
-            record = DedupRecord(
-                key=key,
-                first_seen=now,
-                last_seen=now,
-                count=1,
-                last_message_hash=message_hash,
-            )
-            self.backend.set(key, record, self.ttl_seconds)
-            return record
     
     def clear(self, message: NotifyMessage) -> None:
         """清除消息的去重记录"""
@@ -239,40 +532,37 @@ class RateLimiter:
         """
         self.window_seconds = window_seconds
         self.max_count = max_count
+        # 窗口换算为整数纳秒，时间戳使用 time.monotonic_ns()，不受系统时间调整影响
+        self._window_ns = int(window_seconds * 1_000_000_000)
         
-        self._records: Dict[str, List[float]] = defaultdict(list)
+        # key -> 按时间递增的发送时间戳；deque 限长 max_count + 1（超出配额即可判定，
+        # max_count 为 0 时也能保留记录），过期时间戳从队首 popleft，单条记录内存有上界
+        self._records: Dict[str, Deque[int]] = {}
         self._lock = threading.RLock()
         
         if enable_auto_cleanup:
             self._start_cleanup_thread()
     
     def _start_cleanup_thread(self):
-        """启动自动清理线程"""
-        def cleanup_worker():
-            while True:
-                time.sleep(self.window_seconds)
-                self._cleanup()
-        
-        thread = threading.Thread(target=cleanup_worker, daemon=True)
-        thread.start()
+        """注册到共享的后台清理线程"""
+        _CLEANUP_REGISTRY.register(self._cleanup, self.window_seconds)
     
     def _cleanup(self):
         """清理过期的时间戳"""
         with self._lock:
-            now = time.time()
-            cutoff = now - self.window_seconds
+            cutoff = time.monotonic_ns() - self._window_ns
             
-            for key in list(self._records.keys()):
-                self._records[key] = [
-                    ts for ts in self._records[key] if ts > cutoff
-                ]
-                if not self._records[key]:
-                    del self._records[key]
+            # 单次遍历，只保留仍有未过期时间戳的 key
+            self._records = {
+                key: timestamps
+                for key, timestamps in self._records.items()
+                if _prune(timestamps, cutoff)
+            }
     
     def _get_key(self, message: NotifyMessage) -> str:
         """生成限流 key"""
         # 按来源+级别限流
-        return f"ratelimit:{message.source}:{message.level.name}"
+        return _ratelimit_key(message.source, message.level.name)
     
     def is_allowed(self, message: NotifyMessage) -> Tuple[bool, int]:
         """
@@ -284,45 +574,84 @@ class RateLimiter:
         Returns:
             (是否允许, 当前窗口内已发送数量)
         """
+        # CRITICAL 和 ERROR 级别不限流，直接放行（不加锁、不计数）
+        if message.level in _EXEMPT_LEVELS:
+            return True, 0
+        
         key = self._get_key(message)
-        now = time.time()
-        cutoff = now - self.window_seconds
+        cutoff = time.monotonic_ns() - self._window_ns
         
         with self._lock:
-            # 清理过期时间戳
-            self._records[key] = [
-                ts for ts in self._records[key] if ts > cutoff
-            ]
-            
-            current_count = len(self._records[key])
+            timestamps = self._records.get(key)
+            if not timestamps:
+                return 0 < self.max_count, 0
             
-            # CRITICAL 和 ERROR 级别不限流
-            if message.level in (NotifyLevel.CRITICAL, NotifyLevel.ERROR):
-                return True, current_count
+            if not _prune(timestamps, cutoff):
+                del self._records[key]
+            current_count = len(timestamps)
             
-            if current_count >= self.max_count:
-                return False, current_count
-            
-            return True, current_count
+            return current_count < self.max_count, current_count
     
     def record(self, message: NotifyMessage) -> None:
         """记录消息发送"""
         key = self._get_key(message)
         
         with self._lock:
-            self._records[key].append(time.time())
+            timestamps = self._records.get(key)
+            if timestamps is None:
+                timestamps = self._records[key] = deque(maxlen=self.max_count + 1)
+            timestamps.append(time.monotonic_ns())
+    
+    def acquire(self, message: NotifyMessage) -> Tuple[bool, int]:
+        """
+        检查并占用一次配额（原子操作），发送失败时调用 release 归还
+        
+        与 is_allowed + record 的区别：检查与计数在同一把锁内完成，
+        并发发送时通过的消息数不会超过 max_count
+        
+        Returns:
+            (是否允许, 占用前窗口内已发送数量)
+        """
+        if message.level in _EXEMPT_LEVELS:
+            return True, 0
+        
+        key = self._get_key(message)
+        now = time.monotonic_ns()
+        
+        with self._lock:
+            timestamps = self._records.get(key)
+            if timestamps is None:
+                timestamps = self._records[key] = deque(maxlen=self.max_count + 1)
+            else:
+                _prune(timestamps, now - self._window_ns)
+            current_count = len(timestamps)
+            if current_count >= self.max_count:
+                return False, current_count
+            timestamps.append(now)
+            return True, current_count
+    
+    def release(self, message: NotifyMessage) -> None:
+        """归还 acquire 占用的配额（移除最近一次计数）"""
+        if message.level in _EXEMPT_LEVELS:
+            return
+        
+        with self._lock:
+            timestamps = self._records.get(self._get_key(message))
+            if timestamps:
+                timestamps.pop()
     
     def get_remaining(self, message: NotifyMessage) -> int:
         """获取剩余配额"""
         key = self._get_key(message)
-        now = time.time()
-        cutoff = now - self.window_seconds
+        cutoff = time.monotonic_ns() - self._window_ns
         
         with self._lock:
-            current_count = len([
-                ts for ts in self._records[key] if ts > cutoff
-            ])
-            return max(0, self.max_count - current_count)
+            timestamps = self._records.get(key)
+            if not timestamps:
+                return self.max_count
+            if not _prune(timestamps, cutoff):
+                del self._records[key]
+            return max(0, self.max_count - len(timestamps))
     
     def reset(self, message: Optional[NotifyMessage] = None) -> None:
         """
@@ -339,6 +668,256 @@ class RateLimiter:
                 self._records.clear()
 
 
+class RedisRateLimiter(RateLimiter):
+    """
+    Redis 限流器
+    
+    多进程/多机共享限流计数，使用固定窗口计数:
+    - 占用配额: 一次 Lua 脚本完成 INCR，超出 max_count 时在脚本内 DECR 回滚，
+      多进程并发时通过的消息数不会超过 max_count
+    - 归还配额: 一次 Lua 脚本完成 DECR（计数不会减到 0 以下，也不会创建 key）
+    - 记录发送: 一次 Lua 脚本完成 INCR，首次计数时设置窗口过期时间
+    - 检查: 一次 GET 读取窗口内计数
+    """
+    
+    # 计数 +1，窗口内第一次计数时设置过期时间（毫秒），返回当前计数
+    _INCR_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+return count
+"""
+    
+    # 计数 +1 并检查配额，超出 ARGV[2] 时回滚；返回 {是否允许, 占用前计数}
+    _ACQUIRE_SCRIPT = """
+local count = redis.call('INCR', KEYS[1])
+if count == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[1])
+end
+if count > tonumber(ARGV[2]) then
+    redis.call('DECR', KEYS[1])
+    return {0, count - 1}
+end
+return {1, count - 1}
+"""
+    
+    # 计数 -1；key 已过期或计数为 0 时不做任何操作，避免产生无过期时间的负数 key
+    _RELEASE_SCRIPT = """
+local count = tonumber(redis.call('GET', KEYS[1]) or '0')
+if count > 0 then
+    return redis.call('DECR', KEYS[1])
+end
+return 0
+"""
+    
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        window_seconds: int = 60,
+        max_count: int = 10,
+        client: Any = None,
+        prefix: str = "feishu_notify:",
+    ):
+        """
+        Args:
+            redis_url: Redis URL，client 为 None 时用于创建客户端
+            window_seconds: 时间窗口（秒）
+            max_count: 窗口内最大消息数
+            client: 已有的 redis.Redis 客户端
+            prefix: key 前缀
+        """
+        super().__init__(window_seconds, max_count, enable_auto_cleanup=False)
+        if client is None:
+            if not redis_url:
+                raise ValueError("redis_url is required for RedisRateLimiter")
+            client = create_redis_client(redis_url)
+        self._client = client
+        self._prefix = prefix
+        self._window_ms = int(window_seconds * 1000)
+        # register_script 使用 EVALSHA，脚本未缓存时自动回退到 EVAL
+        self._incr = client.register_script(self._INCR_SCRIPT)
+        self._acquire = client.register_script(self._ACQUIRE_SCRIPT)
+        self._release = client.register_script(self._RELEASE_SCRIPT)
+    
+    def _get_key(self, message: NotifyMessage) -> str:
+        return self._prefix + super()._get_key(message)
+    
+    def _get_count(self, message: NotifyMessage) -> int:
+        raw = self._client.get(self._get_key(message))
+        return int(raw) if raw is not None else 0
+    
+    def _cleanup(self):
+        # 过期由 Redis 处理
+        pass
+    
+    def is_allowed(self, message: NotifyMessage) -> Tuple[bool, int]:
+        # CRITICAL 和 ERROR 级别不限流
+        if message.level in _EXEMPT_LEVELS:
+            return True, 0
+        
+        current_count = self._get_count(message)
+        return current_count < self.max_count, current_count
+    
+    def record(self, message: NotifyMessage) -> None:
+        self._incr(keys=[self._get_key(message)], args=[self._window_ms])
+    
+    def acquire(self, message: NotifyMessage) -> Tuple[bool, int]:
+        if message.level in _EXEMPT_LEVELS:
+            return True, 0
+        
+        allowed, current_count = self._acquire(
+            keys=[self._get_key(message)], args=[self._window_ms, self.max_count]
+        )
+        return bool(allowed), int(current_count)
+    
+    def release(self, message: NotifyMessage) -> None:
+        if message.level in _EXEMPT_LEVELS:
+            return
+        self._release(keys=[self._get_key(message)])
+    
+    def get_remaining(self, message: NotifyMessage) -> int:
+        return max(0, self.max_count - self._get_count(message))
+    
+    def reset(self, message: Optional[NotifyMessage] = None) -> None:
+        if message:
+            self._client.delete(self._get_key(message))
+        else:
+            keys = list(self._client.scan_iter(match=f"{self._prefix}ratelimit:*"))
+            if keys:
+                self._client.delete(*keys)
+
+
+class AsyncRateLimiter:
+    """
+    异步限流器
+    
+    与 RateLimiter 相同的滑动窗口算法，供 asyncio 事件循环内使用:
+    - 检查/记录过程中没有 await，单个事件循环内天然互斥，无需加锁
+    - 实例只能在同一个事件循环（同一线程）中使用，不是线程安全的；
+      跨线程共享请使用 RateLimiter
+    - 过期清理由当前事件循环中的后台任务完成，不占用线程
+    - 独立使用（Notifier 内部使用 RateLimiter）
+    """
+    
+    def __init__(
+        self,
+        window_seconds: int = 60,
+        max_count: int = 10,
+        enable_auto_cleanup: bool = True,
+    ):
+        """
+        初始化限流器
+        
+        Args:
+            window_seconds: 时间窗口（秒）
+            max_count: 窗口内最大消息数
+            enable_auto_cleanup: 是否自动清理过期记录（记录时在当前事件循环中启动）
+        """
+        self.window_seconds = window_seconds
+        self.max_count = max_count
+        self._window_ns = int(window_seconds * 1_000_000_000)
+        self._records: Dict[str, Deque[int]] = {}
+        self._enable_auto_cleanup = enable_auto_cleanup
+        self._cleanup_task: Optional["asyncio.Task"] = None
+    
+    def _get_key(self, message: NotifyMessage) -> str:
+        """生成限流 key"""
+        # 按来源+级别限流
+        return _ratelimit_key(message.source, message.level.name)
+    
+    def _check(self, message: NotifyMessage) -> Tuple[bool, int]:
+        key = self._get_key(message)
+        timestamps = self._records.get(key)
+        if not timestamps:
+            return 0 < self.max_count, 0
+        if not _prune(timestamps, time.monotonic_ns() - self._window_ns):
+            del self._records[key]
+        current_count = len(timestamps)
+        return current_count < self.max_count, current_count
+    
+    def _record(self, message: NotifyMessage) -> None:
+        key = self._get_key(message)
+        timestamps = self._records.get(key)
+        if timestamps is None:
+            timestamps = self._records[key] = deque(maxlen=self.max_count + 1)
+        timestamps.append(time.monotonic_ns())
+        
+        if self._enable_auto_cleanup:
+            self._ensure_cleanup_task()
+    
+    def _ensure_cleanup_task(self) -> None:
+        """确保当前事件循环中有清理任务（如多次 asyncio.run 后原事件循环已关闭）"""
+        loop = asyncio.get_running_loop()
+        task = self._cleanup_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._cleanup_task = loop.create_task(self._cleanup_worker())
+    
+    def _cleanup(self) -> None:
+        """清理过期的时间戳"""
+        cutoff = time.monotonic_ns() - self._window_ns
+        self._records = {
+            key: timestamps
+            for key, timestamps in self._records.items()
+            if _prune(timestamps, cutoff)
+        }
+    
+    async def _cleanup_worker(self) -> None:
+        while True:
+            await asyncio.sleep(self.window_seconds)
+            self._cleanup()
+    
+    async def is_allowed(self, message: NotifyMessage) -> Tuple[bool, int]:
+        """
+        检查消息是否允许发送
+        
+        Args:
+            message: 消息对象
+            
+        Returns:
+            (是否允许, 当前窗口内已发送数量)
+        """
+        # CRITICAL 和 ERROR 级别不限流
+        if message.level in _EXEMPT_LEVELS:
+            return True, 0
+        return self._check(message)
+    
+    async def record(self, message: NotifyMessage) -> None:
+        """记录消息发送"""
+        self._record(message)
+    
+    async def get_remaining(self, message: NotifyMessage) -> int:
+        """获取剩余配额"""
+        _, current_count = self._check(message)
+        return max(0, self.max_count - current_count)
+    
+    def reset(self, message: Optional[NotifyMessage] = None) -> None:
+        """
+        重置限流记录
+        
+        Args:
+            message: 指定消息则只重置该消息的记录，None 则重置所有
+        """
+        if message:
+            self._records.pop(self._get_key(message), None)
+        else:
+            self._records.clear()
+    
+    async def close(self) -> None:
+        """停止后台清理任务"""
+        task = self._cleanup_task
+        if task is None:
+            return
+        self._cleanup_task = None
+        task.cancel()
+        # 属于其他（已关闭的）事件循环的任务只能取消，不能等待
+        if task.get_loop() is asyncio.get_running_loop():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
 class MessageFilter:
     """
     消息过滤器
@@ -391,8 +970,55 @@ class MessageFilter:
         
         return True, "允许发送"
     
-    def mark_sent(self, message: NotifyMessage) -> None:
-        """标记消息已发送"""
+    def acquire(self, message: NotifyMessage) -> Tuple[bool, str]:
+        """
+        判断消息是否应该发送，通过时同时占用去重记录
+        
+        与 should_send 的区别：去重检查与写入、限流检查与计数各是一次原子操作，
+        相同消息并发发送时只有一条通过，并发通过的消息数也不会超过限流配额。
+        通过后发送成功调用 mark_sent(message, claimed=True)，发送失败调用 release(message)
+        
+        Args:
+            message: 消息对象
+            
+        Returns:
+            (是否发送, 原因说明)
+        """
+        claimed = False
+        if self.enable_dedup:
+            claimed, record = self.dedup_manager.claim(message)
+            if not claimed:
+                if record is None:
+                    return False, "消息重复"
+                return False, f"消息重复（已发送 {record.count} 次，首次: {record.first_seen:.0f}）"
+        
+        if self.enable_rate_limit:
+            allowed, count = self.rate_limiter.acquire(message)
+            if not allowed:
+                if claimed:
+                    self.dedup_manager.clear(message)
+                return False, f"触发限流（{self.rate_limiter.window_seconds}s 内已发送 {count} 条）"
+        
+        return True, "允许发送"
+    
+    def release(self, message: NotifyMessage) -> None:
+        """释放 acquire 占用的去重记录和限流配额（发送失败时调用，之后可重新发送）"""
+        if self.enable_dedup:
+            self.dedup_manager.clear(message)
+        if self.enable_rate_limit:
+            self.rate_limiter.release(message)
+    
+    def mark_sent(self, message: NotifyMessage, claimed: bool = False) -> None:
+        """
+        标记消息已发送
+        
+        Args:
+            message: 消息对象
+            claimed: 是否已通过 acquire 占用去重记录和限流配额（已写入，无需再标记）
+        """
+        if claimed:
+            return
+        
         if self.enable_dedup:
             self.dedup_manager.mark(message)
         
@@ -0,0 +1,34 @@
+"""
+JSON 序列化
+
+安装 orjson 时使用 orjson（C 实现，直接输出 bytes），否则回退到标准库 json
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """序列化为 UTF-8 编码的 JSON bytes"""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """解析 JSON（bytes 或 str）"""
+        return orjson.loads(data)
+
+else:
+    def dumps(obj: Any) -> bytes:
+        """序列化为 UTF-8 编码的 JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """解析 JSON（bytes 或 str）"""
+        return json.loads(data)
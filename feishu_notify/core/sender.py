@@ -8,23 +8,139 @@
 """
 
 import asyncio
+import atexit
+import importlib.util
 import logging
+import queue
+import random
+import threading
 import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 import httpx
 
+from . import jsonlib
 from .builder import FeishuCardBuilder
-from .types import NotifyMessage
+from .types import _SLOTS, NotifyMessage
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# 可重试的 4xx：请求超时、触发频率限制
+_RETRYABLE_CLIENT_ERRORS = frozenset((408, 429))
+
+
+def _is_terminal_status(status_code: int) -> bool:
+    """判断 HTTP 状态码是否为不可重试的客户端错误"""
+    return 400 <= status_code < 500 and status_code not in _RETRYABLE_CLIENT_ERRORS
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析 Retry-After 响应头（秒数或 HTTP 日期）
+    
+    Returns:
+        需要等待的秒数；缺失或无法解析时返回 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# HTTP/2 需要可选依赖 h2（pip install httpx[http2]），未安装时使用 HTTP/1.1
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# 进程内共享的同步客户端（按客户端参数区分），所有发送器复用同一连接池，
+# 发往同一 Webhook 域名的请求可复用已建立的 TCP/TLS 连接
+# 异步客户端绑定事件循环，不做跨实例共享
+_SHARED_SYNC_CLIENTS: Dict[Tuple[Any, ...], httpx.Client] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_shared_sync_client(key: Tuple[Any, ...], **client_kwargs: Any) -> httpx.Client:
+    """获取（必要时创建）共享的同步客户端"""
+    client = _SHARED_SYNC_CLIENTS.get(key)
+    if client is None:
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_SYNC_CLIENTS.get(key)
+            if client is None:
+                client = _SHARED_SYNC_CLIENTS[key] = httpx.Client(**client_kwargs)
+    return client
+
+
+@atexit.register
+def close_shared_clients() -> None:
+    """关闭所有共享的同步客户端（进程退出时自动调用）"""
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_SYNC_CLIENTS.values())
+        _SHARED_SYNC_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+class _RetryBudget:
+    """
+    重试预算（令牌桶，进程内所有发送器共享）
+    
+    每次重试消耗 1 个令牌，每次发送成功补充 ratio 个令牌，另外每秒固定补充
+    min_per_second 个令牌：Webhook 持续异常时限制总重试量，避免大量消息同时重试放大故障；
+    故障期间没有成功发送也能按固定速率恢复少量重试，预算不会永久耗尽
+    """
+    
+    def __init__(self, ratio: float = 0.1, capacity: float = 100.0, min_per_second: float = 1.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self.min_per_second = min_per_second
+        self._tokens = capacity
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self) -> None:
+        """按距上次补充的时间补充令牌（调用方持有锁）"""
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.min_per_second)
+    
+    def try_acquire(self) -> bool:
+        """尝试消耗一个令牌，预算不足时返回 False"""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+    
+    def deposit(self) -> None:
+        """发送成功后补充令牌"""
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+
+@dataclass(**_SLOTS)
 class SendResult:
-    """发送结果"""
+    """
+    发送结果
+    
+    使用 __slots__（Python 3.10+），批量发送时减少每个结果的内存占用
+    """
     success: bool
     message: str
     status_code: Optional[int] = None
@@ -40,12 +156,26 @@ class FeishuSender:
     支持同步和异步发送，带自动重试
     """
     
+    # 所有发送器共享的重试预算
+    _retry_budget = _RetryBudget()
+    
+    # send_nowait 使用的线程池（所有发送器共享，首次使用时创建）
+    _nowait_executor: Optional[ThreadPoolExecutor] = None
+    _nowait_executor_lock = threading.Lock()
+    _NOWAIT_MAX_WORKERS = 8
+    
     def __init__(
         self,
         webhook_url: str,
         timeout: float = 10.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+        circuit_threshold: int = 5,
+        circuit_cooldown: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        http2: bool = True,
     ):
         """
         初始化发送器
@@ -54,28 +184,121 @@ class FeishuSender:
             webhook_url: 飞书机器人 Webhook URL
             timeout: 请求超时时间（秒）
             max_retries: 最大重试次数
-            retry_delay: 重试延迟（秒）
+            retry_delay: 重试退避的基准延迟（秒），第 n 次重试的上限为 retry_delay * 2^(n-1)
+            max_retry_delay: 单次重试延迟的上限（秒），同样限制响应头 Retry-After 指定的等待时间
+            circuit_threshold: 连续失败（重试耗尽）多少次后熔断，0 表示不熔断
+            circuit_cooldown: 熔断持续时间（秒），期间直接返回失败，不发起请求
+            max_connections: 连接池最大连接数
+            max_keepalive_connections: 连接池最多保持的空闲长连接数
+            http2: 是否启用 HTTP/2（需安装 h2，未安装时自动使用 HTTP/1.1）
         """
         self.webhook_url = webhook_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        
+        # 每个实例独立的随机源，避免多个发送器的重试时间相互关联
+        self._random = random.Random()
+        
+        # 熔断器：Webhook 持续不可用时快速失败，不再逐条重试
+        self.circuit_threshold = circuit_threshold
+        self.circuit_cooldown = circuit_cooldown
+        self._failure_count = 0
+        self._circuit_opened_at: Optional[float] = None
+        
+        # 连接池配置
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2 and _HTTP2_AVAILABLE
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=30.0,
+        )
         
         self._sync_client: Optional[httpx.Client] = None
         self._async_client: Optional[httpx.AsyncClient] = None
+        self._post_headers = {"Content-Type": "application/json"}
+        
+        # 后台发送队列（首次 send_background 时创建）
+        self._dispatcher: Optional["BackgroundDispatcher"] = None
+        self._dispatcher_lock = threading.Lock()
     
     def _get_sync_client(self) -> httpx.Client:
-        """获取同步 HTTP 客户端"""
+        """获取同步 HTTP 客户端（进程内共享连接池）"""
         if self._sync_client is None:
-            self._sync_client = httpx.Client(timeout=self.timeout)
+            key = (self.timeout, self.max_connections, self.max_keepalive_connections, self.http2)
+            self._sync_client = _get_shared_sync_client(
+                key,
+                timeout=self.timeout,
+                limits=self._limits,
+                http2=self.http2,
+            )
         return self._sync_client
     
     def _get_async_client(self) -> httpx.AsyncClient:
         """获取异步 HTTP 客户端"""
         if self._async_client is None:
-            self._async_client = httpx.AsyncClient(timeout=self.timeout)
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self._limits,
+                http2=self.http2,
+            )
         return self._async_client
     
+    def _compute_backoff(self, attempt: int) -> float:
+        """
+        计算第 attempt 次重试前的等待时间（指数退避 + 完全抖动）
+        
+        在 [0, min(max_retry_delay, retry_delay * 2^(attempt-1))] 内均匀取值，
+        避免大量发送器在同一时刻集中重试
+        """
+        cap = min(self.max_retry_delay, self.retry_delay * (2 ** (attempt - 1)))
+        return self._random.uniform(0, cap)
+    
+    def _circuit_open(self) -> bool:
+        """熔断是否生效中（冷却结束后放行请求试探，再次失败立即重新熔断）"""
+        opened_at = self._circuit_opened_at
+        return opened_at is not None and time.monotonic() - opened_at < self.circuit_cooldown
+    
+    def _record_success(self) -> None:
+        """发送成功：关闭熔断，补充重试预算"""
+        self._retry_budget.deposit()
+        self._failure_count = 0
+        self._circuit_opened_at = None
+    
+    def _record_failure(self) -> None:
+        """重试耗尽仍失败：累计失败次数，达到阈值时熔断"""
+        self._failure_count += 1
+        if self.circuit_threshold and self._failure_count >= self.circuit_threshold:
+            if not self._circuit_open():
+                logger.warning(
+                    "连续 %d 次发送失败，熔断 %ss",
+                    self._failure_count,
+                    self.circuit_cooldown,
+                    extra={"failure_count": self._failure_count},
+                )
+            self._circuit_opened_at = time.monotonic()
+    
+    def _circuit_open_result(self) -> SendResult:
+        return SendResult(
+            success=False,
+            message=f"发送已熔断（连续 {self._failure_count} 次失败），{self.circuit_cooldown}s 内不再请求",
+        )
+    
+    def _message_body(self, message: NotifyMessage) -> Union[bytes, SendResult]:
+        """
+        构建并序列化消息的请求体（每次发送构建一次，重试时复用同一份 bytes）
+        
+        Returns:
+            请求体；序列化失败时返回失败结果
+        """
+        try:
+            return FeishuCardBuilder(message).to_webhook_bytes()
+        except (TypeError, ValueError) as e:
+            return SendResult(success=False, message=f"payload 序列化失败: {e}")
+    
     def send(self, message: NotifyMessage) -> SendResult:
         """
         同步发送消息
@@ -86,8 +309,10 @@ class FeishuSender:
         Returns:
             发送结果
         """
-        payload = FeishuCardBuilder(message).to_webhook_payload()
-        return self.send_raw(payload)
+        body = self._message_body(message)
+        if isinstance(body, SendResult):
+            return body
+        return self._send_body(body)
     
     async def send_async(self, message: NotifyMessage) -> SendResult:
         """
@@ -99,8 +324,10 @@ class FeishuSender:
         Returns:
             发送结果
         """
-        payload = FeishuCardBuilder(message).to_webhook_payload()
-        return await self.send_raw_async(payload)
+        body = self._message_body(message)
+        if isinstance(body, SendResult):
+            return body
+        return await self._send_body_async(body)
     
     def send_raw(self, payload: Dict[str, Any]) -> SendResult:
         """
@@ -112,65 +339,167 @@ class FeishuSender:
         Returns:
             发送结果
         """
+        # 只序列化一次，重试时复用同一份请求体
+        try:
+            body = jsonlib.dumps(payload)
+        except (TypeError, ValueError) as e:
+            return SendResult(success=False, message=f"payload 序列化失败: {e}")
+        return self._send_body(body)
+    
+    def _send_body(self, body: bytes) -> SendResult:
+        """同步发送已序列化的请求体（按 _retry_plan 重试）"""
+        if self._circuit_open():
+            return self._circuit_open_result()
+        
         client = self._get_sync_client()
-        retries = 0
+        plan = self._retry_plan()
+        try:
+            step = next(plan)
+            while True:
+                if step is None:
+                    try:
+                        outcome = client.post(
+                            self.webhook_url,
+                            content=body,
+                            headers=self._post_headers,
+                        )
+                    except Exception as e:
+                        outcome = e
+                    step = plan.send(outcome)
+                else:
+                    time.sleep(step)
+                    step = plan.send(None)
+        except StopIteration as stop:
+            return stop.value
+    
+    def _retry_plan(self) -> Generator[Optional[float], Any, SendResult]:
+        """
+        重试决策（同步/异步发送共用的状态机）
+        
+        由调用方驱动:
+        - yield None: 发起一次请求，调用方 send 回响应或请求时抛出的异常
+        - yield 秒数: 等待后再继续，调用方 send 回 None
+        - return: 最终的发送结果
+        """
+        max_retries = self.max_retries
         last_error = None
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
+        retry_after = None
         
-        while retries <= self.max_retries:
-            try:
-                response = client.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                
-                elapsed_ms = (time.time() - start_time) * 1000
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("code") == 0 or data.get("StatusCode") == 0:
-                        return SendResult(
-                            success=True,
-                            message="发送成功",
-                            status_code=response.status_code,
-                            response_data=data,
-                            retries=retries,
-                            elapsed_ms=elapsed_ms,
-                        )
-                    else:
-                        error_msg = data.get("msg") or data.get("StatusMessage") or "Unknown error"
-                        return SendResult(
-                            success=False,
-                            message=f"飞书返回错误: {error_msg}",
-                            status_code=response.status_code,
-                            response_data=data,
-                            retries=retries,
-                            elapsed_ms=elapsed_ms,
-                        )
+        for retries in range(max_retries + 1):
+            outcome = yield None
+            elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+            
+            if isinstance(outcome, httpx.Response):
+                try:
+                    result = self._handle_response(outcome, retries, elapsed_ms)
+                except Exception as e:
+                    last_error = f"未知错误: {e}"
                 else:
-                    last_error = f"HTTP {response.status_code}"
-                    
-            except httpx.TimeoutException as e:
-                last_error = f"请求超时: {e}"
-            except httpx.HTTPError as e:
-                last_error = f"HTTP 错误: {e}"
-            except Exception as e:
-                last_error = f"未知错误: {e}"
+                    if result is not None:
+                        return result
+                    last_error = f"HTTP {outcome.status_code}"
+                    # 429/503 等响应可能带 Retry-After，按服务端要求的时间等待
+                    retry_after = _parse_retry_after(outcome.headers.get("Retry-After"))
+            elif isinstance(outcome, (httpx.InvalidURL, httpx.UnsupportedProtocol)):
+                # Webhook URL 无效，重试不会成功
+                return SendResult(
+                    success=False,
+                    message=f"Webhook URL 无效: {outcome}",
+                    retries=retries,
+                    elapsed_ms=elapsed_ms,
+                )
+            elif isinstance(outcome, httpx.TimeoutException):
+                last_error = f"请求超时: {outcome}"
+            elif isinstance(outcome, httpx.HTTPError):
+                last_error = f"HTTP 错误: {outcome}"
+            else:
+                last_error = f"未知错误: {outcome}"
+            
+            if retries == max_retries:
+                break
             
-            retries += 1
-            if retries <= self.max_retries:
-                logger.warning(f"发送失败，{self.retry_delay}s 后重试 ({retries}/{self.max_retries}): {last_error}")
-                time.sleep(self.retry_delay)
+            if not self._retry_budget.try_acquire():
+                self._record_failure()
+                return SendResult(
+                    success=False,
+                    message=f"发送失败（重试预算已耗尽）: {last_error}",
+                    retries=retries,
+                    elapsed_ms=(time.monotonic_ns() - start_ns) / 1_000_000,
+                )
+            attempt = retries + 1
+            delay = self._compute_backoff(attempt)
+            if retry_after is not None:
+                delay = min(max(delay, retry_after), self.max_retry_delay)
+                retry_after = None
+            logger.warning(
+                "发送失败，%.1fs 后重试 (%d/%d): %s",
+                delay,
+                attempt,
+                max_retries,
+                last_error,
+                extra={
+                    "attempt": attempt,
+                    "elapsed_ms": elapsed_ms,
+                    "status_code": outcome.status_code if isinstance(outcome, httpx.Response) else None,
+                },
+            )
+            yield delay
         
-        elapsed_ms = (time.time() - start_time) * 1000
+        self._record_failure()
+        elapsed_ms = (time.monotonic_ns() - start_ns) / 1_000_000
         return SendResult(
             success=False,
-            message=f"发送失败（已重试 {self.max_retries} 次）: {last_error}",
-            retries=retries - 1,
+            message=f"发送失败（已重试 {max_retries} 次）: {last_error}",
+            retries=max_retries,
             elapsed_ms=elapsed_ms,
         )
     
+    def _handle_response(
+        self,
+        response: httpx.Response,
+        retries: int,
+        elapsed_ms: float,
+    ) -> Optional[SendResult]:
+        """
+        处理 HTTP 响应
+        
+        Returns:
+            最终结果；需要重试时返回 None
+        """
+        if response.status_code == 200:
+            # 直接解析原始 bytes，省去 httpx 先解码为 str 再走标准库 json 的开销
+            data = jsonlib.loads(response.content)
+            if data.get("code") == 0 or data.get("StatusCode") == 0:
+                self._record_success()
+                return SendResult(
+                    success=True,
+                    message="发送成功",
+                    status_code=response.status_code,
+                    response_data=data,
+                    retries=retries,
+                    elapsed_ms=elapsed_ms,
+                )
+            error_msg = data.get("msg") or data.get("StatusMessage") or "Unknown error"
+            return SendResult(
+                success=False,
+                message=f"飞书返回错误: {error_msg}",
+                status_code=response.status_code,
+                response_data=data,
+                retries=retries,
+                elapsed_ms=elapsed_ms,
+            )
+        if _is_terminal_status(response.status_code):
+            # 请求本身有误（如 400/401/403/404），重试不会成功
+            return SendResult(
+                success=False,
+                message=f"发送失败: HTTP {response.status_code}",
+                status_code=response.status_code,
+                retries=retries,
+                elapsed_ms=elapsed_ms,
+            )
+        return None
+    
     async def send_raw_async(self, payload: Dict[str, Any]) -> SendResult:
         """
         异步发送原始 payload
@@ -181,70 +510,117 @@ class FeishuSender:
         Returns:
             发送结果
         """
-        client = self._get_async_client()
-        retries = 0
-        last_error = None
-        start_time = time.time()
+        # 只序列化一次，重试时复用同一份请求体
+        try:
+            body = jsonlib.dumps(payload)
+        except (TypeError, ValueError) as e:
+            return SendResult(success=False, message=f"payload 序列化失败: {e}")
+        return await self._send_body_async(body)
+    
+    async def _send_body_async(self, body: bytes) -> SendResult:
+        """异步发送已序列化的请求体（按 _retry_plan 重试）"""
+        if self._circuit_open():
+            return self._circuit_open_result()
         
-        while retries <= self.max_retries:
-            try:
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                
-                elapsed_ms = (time.time() - start_time) * 1000
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("code") == 0 or data.get("StatusCode") == 0:
-                        return SendResult(
-                            success=True,
-                            message="发送成功",
-                            status_code=response.status_code,
-                            response_data=data,
-                            retries=retries,
-                            elapsed_ms=elapsed_ms,
-                        )
-                    else:
-                        error_msg = data.get("msg") or data.get("StatusMessage") or "Unknown error"
-                        return SendResult(
-                            success=False,
-                            message=f"飞书返回错误: {error_msg}",
-                            status_code=response.status_code,
-                            response_data=data,
-                            retries=retries,
-                            elapsed_ms=elapsed_ms,
+        client = self._get_async_client()
+        plan = self._retry_plan()
+        try:
+            step = next(plan)
+            while True:
+                if step is None:
+                    try:
+                        outcome = await client.post(
+                            self.webhook_url,
+                            content=body,
+                            headers=self._post_headers,
                         )
+                    except Exception as e:
+                        outcome = e
+                    step = plan.send(outcome)
                 else:
-                    last_error = f"HTTP {response.status_code}"
-                    
-            except httpx.TimeoutException as e:
-                last_error = f"请求超时: {e}"
-            except httpx.HTTPError as e:
-                last_error = f"HTTP 错误: {e}"
-            except Exception as e:
-                last_error = f"未知错误: {e}"
+                    await asyncio.sleep(step)
+                    step = plan.send(None)
+        except StopIteration as stop:
+            return stop.value
+    
+    async def send_many_async(
+        self,
+        payloads: List[Dict[str, Any]],
+        concurrency: int = 10,
+    ) -> List[SendResult]:
+        """
+        异步批量发送原始 payload（并发数受限，共用同一连接池）
+        
+        Args:
+            payloads: 飞书消息 payload 列表
+            concurrency: 最大并发请求数
             
-            retries += 1
-            if retries <= self.max_retries:
-                logger.warning(f"发送失败，{self.retry_delay}s 后重试 ({retries}/{self.max_retries}): {last_error}")
-                await asyncio.sleep(self.retry_delay)
+        Returns:
+            与 payloads 一一对应的发送结果，单条异常转为失败结果
+        """
+        semaphore = asyncio.Semaphore(concurrency)
         
-        elapsed_ms = (time.time() - start_time) * 1000
-        return SendResult(
-            success=False,
-            message=f"发送失败（已重试 {self.max_retries} 次）: {last_error}",
-            retries=retries - 1,
-            elapsed_ms=elapsed_ms,
-        )
+        async def send_one(payload: Dict[str, Any]) -> SendResult:
+            async with semaphore:
+                try:
+                    return await self.send_raw_async(payload)
+                except Exception as e:
+                    return SendResult(success=False, message=f"发送异常: {e}")
+        
+        return list(await asyncio.gather(*(send_one(p) for p in payloads)))
+    
+    def send_background(self, message: NotifyMessage) -> bool:
+        """
+        后台发送消息（立即返回，不等待请求完成）
+        
+        消息放入后台队列，由工作线程批量发送；调用 close() 时会先发送完队列中的消息
+        
+        Args:
+            message: 消息对象
+            
+        Returns:
+            是否成功入队（队列已满时返回 False）
+        """
+        if self._dispatcher is None:
+            with self._dispatcher_lock:
+                if self._dispatcher is None:
+                    self._dispatcher = BackgroundDispatcher(self)
+        return self._dispatcher.submit(FeishuCardBuilder(message).to_webhook_payload())
+    
+    def send_nowait(self, message: NotifyMessage) -> "Future[SendResult]":
+        """
+        在共享线程池中发送消息（立即返回，重试等待不阻塞调用线程）
+        
+        与 send_background 不同，每条消息单独发送，可通过 Future 获取发送结果
+        
+        Args:
+            message: 消息对象
+            
+        Returns:
+            发送结果的 Future
+        """
+        executor = FeishuSender._nowait_executor
+        if executor is None:
+            with FeishuSender._nowait_executor_lock:
+                executor = FeishuSender._nowait_executor
+                if executor is None:
+                    executor = FeishuSender._nowait_executor = ThreadPoolExecutor(
+                        max_workers=self._NOWAIT_MAX_WORKERS,
+                        thread_name_prefix="feishu-notify-nowait",
+                    )
+        return executor.submit(self.send, message)
     
     def close(self):
-        """关闭同步客户端"""
-        if self._sync_client:
-            self._sync_client.close()
-            self._sync_client = None
+        """释放同步客户端（共享客户端由其他发送器继续使用，不关闭）"""
+        dispatcher = self._dispatcher
+        if dispatcher is not None:
+            self._dispatcher = None
+            dispatcher.close()
+        
+        client = self._sync_client
+        self._sync_client = None
+        if client is not None and client not in _SHARED_SYNC_CLIENTS.values():
+            client.close()
     
     async def close_async(self):
         """关闭异步客户端"""
@@ -253,14 +629,190 @@ class FeishuSender:
             self._async_client = None
     
     def __enter__(self):
+        # 进入时即创建客户端，首次发送不再承担客户端构建开销
+        self._get_sync_client()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
     
     async def __aenter__(self):
+        self._get_async_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close_async()
 
+
+
+# 停止后台工作线程的哨兵
+_STOP = object()
+
+# 未关闭的后台发送队列（弱引用），进程退出时发送完剩余消息
+_OPEN_DISPATCHERS: "weakref.WeakSet[BackgroundDispatcher]" = weakref.WeakSet()
+_OPEN_DISPATCHERS_LOCK = threading.Lock()
+
+# 进程退出时等待单个后台发送队列发送完的最长时间（秒）
+_ATEXIT_CLOSE_TIMEOUT = 10.0
+
+
+@atexit.register
+def close_background_dispatchers() -> None:
+    """
+    关闭所有未关闭的后台发送队列（进程退出时自动调用）
+    
+    工作线程是守护线程，不关闭则队列中的消息会随进程退出丢失；
+    注册晚于 close_shared_clients，因此先于它执行，发送时共享客户端仍可用
+    """
+    with _OPEN_DISPATCHERS_LOCK:
+        dispatchers = list(_OPEN_DISPATCHERS)
+    for dispatcher in dispatchers:
+        dispatcher.close(_ATEXIT_CLOSE_TIMEOUT)
+
+
+class BackgroundDispatcher:
+    """
+    后台发送队列
+    
+    调用方只负责入队，工作线程取出当前队列中的所有 payload 按批次并发发送，
+    发送耗时不阻塞调用方（适合 ETL 任务中的通知）
+    
+    Usage:
+        dispatcher = BackgroundDispatcher(sender)
+        dispatcher.submit(payload)
+        ...
+        dispatcher.close()  # 发送完剩余消息后退出
+    
+    未调用 close 时，进程退出时会自动关闭并发送剩余消息（最多等待 _ATEXIT_CLOSE_TIMEOUT 秒）
+    """
+    
+    def __init__(
+        self,
+        sender: FeishuSender,
+        max_queue: int = 1000,
+        max_batch: int = 50,
+        flush_interval: float = 0.1,
+        concurrency: int = 5,
+        on_result: Optional[Callable[[SendResult], None]] = None,
+    ):
+        """
+        Args:
+            sender: 发送器
+            max_queue: 队列容量，已满时 submit 返回 False
+            max_batch: 单批最多发送的 payload 数
+            flush_interval: 收到第一条后等待凑批的最长时间（秒）
+            concurrency: 单批内的最大并发请求数
+            on_result: 每条发送结果的回调（在工作线程中调用）
+        """
+        self.sender = sender
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.on_result = on_result
+        
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        # 保护 _closed 与入队：关闭后不会再有消息排在停止信号之后
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="feishu-notify-send")
+        self._thread = threading.Thread(target=self._run, name="feishu-notify-dispatcher", daemon=True)
+        self._thread.start()
+        with _OPEN_DISPATCHERS_LOCK:
+            _OPEN_DISPATCHERS.add(self)
+    
+    def submit(self, payload: Dict[str, Any]) -> bool:
+        """
+        payload 入队
+        
+        Returns:
+            是否成功入队（队列已满或已关闭时返回 False）
+        """
+        with self._lock:
+            if self._closed:
+                return False
+            try:
+                self._queue.put_nowait(payload)
+                return True
+            except queue.Full:
+                pass
+        logger.warning("后台发送队列已满，消息被丢弃")
+        return False
+    
+    def _next_batch(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        取出一批 payload：阻塞等待第一条，之后在 flush_interval 内尽量凑满一批
+        
+        Returns:
+            (payload 列表, 是否收到停止信号)
+        """
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        
+        batch = [item]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _run(self) -> None:
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                if batch:
+                    for result in self._send_batch(batch):
+                        if self.on_result is not None:
+                            try:
+                                self.on_result(result)
+                            except Exception:
+                                logger.exception("后台发送结果回调异常")
+                if stop:
+                    return
+        finally:
+            # 线程池只由工作线程使用，由它在退出时关闭（close 等待超时时工作线程仍在发送）
+            self._executor.shutdown(wait=True)
+    
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> List[SendResult]:
+        """并发发送一批 payload，结果与 batch 一一对应"""
+        futures = []
+        rest: List[SendResult] = []
+        for index, payload in enumerate(batch):
+            try:
+                futures.append(self._executor.submit(self._send_one, payload))
+            except RuntimeError:
+                # 解释器退出阶段（atexit 中 close）线程池不再接受任务，剩余的在工作线程中逐条发送
+                rest = [self._send_one(item) for item in batch[index:]]
+                break
+        return [future.result() for future in futures] + rest
+    
+    def _send_one(self, payload: Dict[str, Any]) -> SendResult:
+        try:
+            return self.sender.send_raw(payload)
+        except Exception as e:
+            return SendResult(success=False, message=f"发送异常: {e}")
+    
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        停止接收新消息，发送完队列中的消息后退出
+        
+        Args:
+            timeout: 等待工作线程退出的最长时间（秒），None 表示一直等待；
+                     超时后工作线程继续在后台发送剩余消息
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        with _OPEN_DISPATCHERS_LOCK:
+            _OPEN_DISPATCHERS.discard(self)
+        # 置位后不会再有消息入队，停止信号一定排在所有消息之后
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("后台发送队列未在 %ss 内发送完，剩余消息继续在后台发送", timeout)
@@ -4,12 +4,36 @@
 定义了 6 级消息分类体系和统一的消息数据结构
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
 
+# 最近一次格式化的时间戳: (精确到秒的 naive datetime, 格式化结果)
+# 整体替换元组而非原地修改，多线程下最坏情况只是重复格式化一次
+_TS_CACHE: tuple = (None, "")
+
+
+def _format_timestamp(dt: datetime) -> str:
+    """格式化为 YYYY-MM-DD HH:MM:SS，同一秒内的 naive 时间复用上次结果"""
+    global _TS_CACHE
+    if dt.tzinfo is not None:
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    key = dt.replace(microsecond=0)
+    cached_key, cached_str = _TS_CACHE
+    if key == cached_key:
+        return cached_str
+    formatted = dt.strftime("%Y-%m-%d %H:%M:%S")
+    _TS_CACHE = (key, formatted)
+    return formatted
+
+
+# Python 3.10+ 支持 dataclass(slots=True)，旧版本退化为普通 dataclass
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class NotifyLevel(Enum):
     """
     通知级别枚举
@@ -23,37 +47,33 @@ class NotifyLevel(Enum):
     INFO = ("P4", "blue", "ℹ️", "[通知]")
     PENDING = ("P5", "purple", "⏳", "[待办]")
     
-    @property
-    def priority(self) -> str:
-        """获取优先级标识 (P0-P5)"""
-        return self.value[0]
-    
-    @property
-    def color(self) -> str:
-        """获取飞书卡片颜色模板"""
-        return self.value[1]
-    
-    @property
-    def emoji(self) -> str:
-        """获取对应的 Emoji"""
-        return self.value[2]
-    
-    @property
-    def prefix(self) -> str:
-        """获取标题前缀"""
-        return self.value[3]
+    def __new__(cls, priority: str, color: str, emoji: str, prefix: str):
+        obj = object.__new__(cls)
+        # value 仍为完整元组，保持 NotifyLevel(("P0", ...)) 与 .value 的原有语义
+        obj._value_ = (priority, color, emoji, prefix)
+        # 直接绑定为实例属性（驻留字符串），读取时无需经过 property 与元组下标
+        obj.priority = sys.intern(priority)  # 优先级标识 (P0-P5)
+        obj.color = sys.intern(color)  # 飞书卡片颜色模板
+        obj.emoji = sys.intern(emoji)  # 对应的 Emoji
+        obj.prefix = sys.intern(prefix)  # 标题前缀
+        obj.title_lead = sys.intern(f"{emoji} {prefix} ")  # 预拼接的标题头（含尾随空格），标题只需一次拼接
+        return obj
     
     @classmethod
     def from_string(cls, level_str: str) -> "NotifyLevel":
         """从字符串创建枚举值"""
         level_str = level_str.upper()
-        for level in cls:
-            if level.name == level_str:
-                return level
-        raise ValueError(f"Unknown notify level: {level_str}")
+        try:
+            return _LEVEL_BY_NAME[level_str]
+        except KeyError:
+            raise ValueError(f"Unknown notify level: {level_str}") from None
+
 
+# 名称 -> 级别（from_string 用，O(1) 查找）
+_LEVEL_BY_NAME: Dict[str, NotifyLevel] = {level.name: level for level in NotifyLevel}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class LinkButton:
     """操作按钮/链接"""
     text: str
@@ -69,11 +89,26 @@ class LinkButton:
         }
 
 
-@dataclass
+def _normalize_links(links: List[Any]) -> List[LinkButton]:
+    """将 dict 格式的链接转换为 LinkButton，已是 LinkButton 的原样保留"""
+    return [
+        LinkButton(
+            text=link.get("text", "查看详情"),
+            url=link.get("url", ""),
+            is_danger=link.get("is_danger", False),
+        ) if isinstance(link, dict) else link
+        for link in links
+    ]
+
+
+@dataclass(eq=False, **_SLOTS)
 class NotifyMessage:
     """
     统一消息模型
     
+    使用 __slots__（Python 3.10+），实例不携带 __dict__，不能动态添加属性
+    不生成逐字段比较的 __eq__：消息按对象标识比较，去重请使用 dedupe_key
+    
     综合了四份提案的设计，支持:
     - 上下文信息 (source, task_name, task_id)
     - 指标数据 (metrics)
@@ -130,28 +165,39 @@ class NotifyMessage:
         if self.mentions is None:
             self.mentions = []
         
-        # 将 dict 格式的 links 转换为 LinkButton
+        # 来源/任务名在批量消息中高度重复，驻留后共享同一字符串对象
+        if type(self.source) is str:
+            self.source = sys.intern(self.source)
+        if type(self.task_name) is str:
+            self.task_name = sys.intern(self.task_name)
+        
+        # 兼容直接传入 dict 格式的 links（推荐使用 from_raw）
         if self.links and isinstance(self.links[0], dict):
-            self.links = [
-                LinkButton(
-                    text=link.get("text", "查看详情"),
-                    url=link.get("url", ""),
-                    is_danger=link.get("is_danger", False),
-                )
-                for link in self.links
-            ]
+            self.links = _normalize_links(self.links)
+    
+    @classmethod
+    def from_raw(cls, **kwargs) -> "NotifyMessage":
+        """
+        从原始参数创建消息，links 可为 dict 与 LinkButton 混合的列表
+        
+        逐个转换 links 后再构造，__post_init__ 无需再做类型转换
+        """
+        links = kwargs.get("links")
+        if links:
+            kwargs["links"] = _normalize_links(links)
+        return cls(**kwargs)
     
     @property
     def formatted_title(self) -> str:
         """获取格式化的标题（含 Emoji 和前缀）"""
-        return f"{self.level.emoji} {self.level.prefix} {self.title}"
+        return self.level.title_lead + self.title
     
     @property
     def formatted_timestamp(self) -> str:
         """获取格式化的时间戳"""
         if self.timestamp:
-            return self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            return _format_timestamp(self.timestamp)
+        return _format_timestamp(datetime.now())
     
     def add_link(self, text: str, url: str, is_danger: bool = False) -> "NotifyMessage":
         """添加链接按钮（链式调用）"""
@@ -160,6 +206,8 @@ class NotifyMessage:
     
     def add_mention(self, user_id: str) -> "NotifyMessage":
         """添加 @ 用户（链式调用）"""
+        # mentions 是调用方可直接修改的公开列表（通常只有几个用户），
+        # 直接在列表上判断，不维护可能与列表不一致的辅助集合
         if user_id not in self.mentions:
             self.mentions.append(user_id)
         return self
@@ -4,12 +4,21 @@
 提供简洁易用的 API，支持快捷方法和高级配置
 """
 
+import asyncio
+import dataclasses
 import logging
 from typing import Any, Dict, List, Optional, Union
 
 from .config import NotifyConfig
 from .core.builder import FeishuCardBuilder
-from .core.dedup import DedupManager, MessageFilter, RateLimiter
+from .core.dedup import (
+    DedupManager,
+    MessageFilter,
+    RateLimiter,
+    RedisDedupBackend,
+    RedisRateLimiter,
+    create_redis_client,
+)
 from .core.sender import FeishuSender, SendResult
 from .core.types import LinkButton, NotifyLevel, NotifyMessage
 from .templates.loader import TemplateLoader
@@ -18,6 +27,18 @@ from .templates.loader import TemplateLoader
 logger = logging.getLogger(__name__)
 
 
+def _no_pre_send(message: NotifyMessage) -> NotifyMessage:
+    """无需预处理"""
+    return message
+
+
+def _mention_all_if_unset(message: NotifyMessage) -> NotifyMessage:
+    """未指定 @ 对象时默认 @ 所有人（返回副本，不修改调用方的消息）"""
+    if not message.mention_all and not message.mentions:
+        return dataclasses.replace(message, mention_all=True)
+    return message
+
+
 class Notifier:
     """
     飞书通知器
@@ -69,8 +90,17 @@ class Notifier:
             timeout=self.config.timeout_seconds,
             max_retries=self.config.max_retries,
             retry_delay=self.config.retry_delay,
+            max_retry_delay=self.config.max_retry_delay,
+            circuit_threshold=self.config.circuit_threshold,
+            circuit_cooldown=self.config.circuit_cooldown,
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive_connections,
+            http2=self.config.http2,
         )
         
+        # Redis 客户端（仅使用 Redis 去重/限流后端时创建）
+        self._redis_client = None
+        
         # 模板加载器
         self._template_loader = TemplateLoader(
             template_dir=self.config.template_dir,
@@ -78,11 +108,8 @@ class Notifier:
         )
         
         # 消息过滤器（去重+限流）
-        dedup_manager = DedupManager(ttl_seconds=self.config.dedup_ttl_seconds) if enable_dedup else None
-        rate_limiter = RateLimiter(
-            window_seconds=self.config.rate_limit_window,
-            max_count=self.config.rate_limit_max_count,
-        ) if enable_rate_limit else None
+        dedup_manager = self._create_dedup_manager() if enable_dedup else None
+        rate_limiter = self._create_rate_limiter() if enable_rate_limit else None
         
         self._filter = MessageFilter(
             dedup_manager=dedup_manager,
@@ -92,6 +119,49 @@ class Notifier:
         )
         
         self._source = source
+        
+        # 已缓存到实例字典的模板方法名（见 __getattr__）
+        self._template_methods = set()
+        
+        # 各级别的发送前处理，在初始化时按配置确定，发送时直接查表
+        self._pre_send = {level: _no_pre_send for level in NotifyLevel}
+        if self.config.critical_mention_all:
+            self._pre_send[NotifyLevel.CRITICAL] = _mention_all_if_unset
+    
+    def _get_redis_client(self) -> Any:
+        """获取共享的 Redis 客户端（去重与限流共用一个连接池）"""
+        if self._redis_client is None:
+            if not self.config.redis_url:
+                raise ValueError("redis_url is required for redis backend. Set it via config or FEISHU_REDIS_URL env var.")
+            self._redis_client = create_redis_client(self.config.redis_url)
+        return self._redis_client
+    
+    def _create_dedup_manager(self) -> DedupManager:
+        """按配置创建去重管理器"""
+        if self.config.dedup_backend == "redis":
+            # 过期由 Redis 负责，无需本地清理线程
+            return DedupManager(
+                backend=RedisDedupBackend(client=self._get_redis_client()),
+                ttl_seconds=self.config.dedup_ttl_seconds,
+                enable_auto_cleanup=False,
+            )
+        return DedupManager(
+            ttl_seconds=self.config.dedup_ttl_seconds,
+            max_entries=self.config.dedup_max_entries,
+        )
+    
+    def _create_rate_limiter(self) -> RateLimiter:
+        """按配置创建限流器"""
+        if self.config.rate_limit_backend == "redis":
+            return RedisRateLimiter(
+                window_seconds=self.config.rate_limit_window,
+                max_count=self.config.rate_limit_max_count,
+                client=self._get_redis_client(),
+            )
+        return RateLimiter(
+            window_seconds=self.config.rate_limit_window,
+            max_count=self.config.rate_limit_max_count,
+        )
     
     def _create_message(
         self,
@@ -101,20 +171,20 @@ class Notifier:
         **kwargs
     ) -> NotifyMessage:
         """创建消息对象"""
+        source = kwargs.pop("source", self._source)
+        
+        # 快速路径：未传入链接参数（quick 方法的常见用法）时直接构造
+        if "links" not in kwargs and "link_url" not in kwargs:
+            return NotifyMessage(
+                level=level,
+                title=title,
+                content=content,
+                source=source,
+                **kwargs
+            )
+        
         # 处理 links 参数
-        links = kwargs.pop("links", None)
-        if links:
-            if isinstance(links[0], dict):
-                links = [
-                    LinkButton(
-                        text=link.get("text", "查看详情"),
-                        url=link.get("url", ""),
-                        is_danger=link.get("is_danger", False),
-                    )
-                    for link in links
-                ]
-        else:
-            links = []
+        links = list(kwargs.pop("links", None) or ())
         
         # 处理单个 link 快捷参数
         if "link_url" in kwargs:
@@ -122,15 +192,38 @@ class Notifier:
             link_text = kwargs.pop("link_text", "查看详情")
             links.append(LinkButton(text=link_text, url=link_url))
         
-        return NotifyMessage(
+        return NotifyMessage.from_raw(
             level=level,
             title=title,
             content=content,
-            source=kwargs.pop("source", self._source),
+            source=source,
             links=links,
             **kwargs
         )
     
+    def _filter_message(self, message: NotifyMessage, force: bool) -> Optional[SendResult]:
+        """
+        发送前检查去重/限流，通过时占用去重记录（同步/异步共用）
+        
+        Returns:
+            消息被过滤时返回对应的发送结果，否则返回 None
+        """
+        if not force:
+            should_send, reason = self._filter.acquire(message)
+            if not should_send:
+                logger.info(f"消息被过滤: {reason}")
+                return SendResult(success=False, message=reason)
+        return None
+    
+    def _after_send(self, message: NotifyMessage, result: Optional[SendResult], force: bool) -> None:
+        """
+        发送后处理：成功时标记已发送；失败（含异常）时释放发送前占用的去重记录
+        """
+        if result is not None and result.success:
+            self._filter.mark_sent(message, claimed=not force)
+        elif not force:
+            self._filter.release(message)
+    
     def send(self, message: NotifyMessage, force: bool = False) -> SendResult:
         """
         同步发送消息
@@ -142,25 +235,19 @@ class Notifier:
         Returns:
             发送结果
         """
-        # 检查是否应该发送
-        if not force:
-            should_send, reason = self._filter.should_send(message)
-            if not should_send:
-                logger.info(f"消息被过滤: {reason}")
-                return SendResult(success=False, message=reason)
+        filtered = self._filter_message(message, force)
+        if filtered is not None:
+            return filtered
         
-        # 处理 CRITICAL 级别的默认 @ 所有人
-        if message.level == NotifyLevel.CRITICAL and self.config.critical_mention_all:
-            if not message.mention_all and not message.mentions:
-                message.mention_all = True
+        # 按级别预处理（如 CRITICAL 级别的默认 @ 所有人），不修改调用方的消息
+        message = self._pre_send[message.level](message)
         
         # 发送
-        result = self._sender.send(message)
-        
-        # 标记已发送
-        if result.success:
-            self._filter.mark_sent(message)
-        
+        result = None
+        try:
+            result = self._sender.send(message)
+        finally:
+            self._after_send(message, result, force)
         return result
     
     async def send_async(self, message: NotifyMessage, force: bool = False) -> SendResult:
@@ -174,26 +261,53 @@ class Notifier:
         Returns:
             发送结果
         """
-        # 检查是否应该发送
-        if not force:
-            should_send, reason = self._filter.should_send(message)
-            if not should_send:
-                logger.info(f"消息被过滤: {reason}")
-                return SendResult(success=False, message=reason)
+        filtered = self._filter_message(message, force)
+        if filtered is not None:
+            return filtered
         
-        # 处理 CRITICAL 级别的默认 @ 所有人
-        if message.level == NotifyLevel.CRITICAL and self.config.critical_mention_all:
-            if not message.mention_all and not message.mentions:
-                message.mention_all = True
+        # 按级别预处理（如 CRITICAL 级别的默认 @ 所有人），不修改调用方的消息
+        message = self._pre_send[message.level](message)
         
         # 发送
-        result = await self._sender.send_async(message)
+        result = None
+        try:
+            result = await self._sender.send_async(message)
+        finally:
+            self._after_send(message, result, force)
+        return result
+    
+    async def send_many_async(
+        self,
+        messages: List[NotifyMessage],
+        force: bool = False,
+        max_concurrency: Optional[int] = None,
+    ) -> List[SendResult]:
+        """
+        异步批量发送消息（并发数受限）
+        
+        Args:
+            messages: 消息列表
+            force: 是否强制发送（跳过去重/限流检查）
+            max_concurrency: 最大并发请求数，None 则使用配置 max_concurrent_requests
+            
+        Returns:
+            与 messages 一一对应的发送结果
+            
+        Note:
+            去重/限流检查在获得并发名额后、发送前进行：被过滤的消息不发起请求，
+            检查本身不含 await，几乎不占用名额；若在获得名额前统一检查，
+            同批消息会在任何一条发送成功之前全部通过限流
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.config.max_concurrent_requests)
         
-        # 标记已发送
-        if result.success:
-            self._filter.mark_sent(message)
+        async def send_one(message: NotifyMessage) -> SendResult:
+            async with semaphore:
+                try:
+                    return await self.send_async(message, force=force)
+                except Exception as e:
+                    return SendResult(success=False, message=f"发送异常: {e}")
         
-        return result
+        return list(await asyncio.gather(*(send_one(m) for m in messages)))
     
     # ==================== 快捷方法 ====================
     
@@ -440,11 +554,16 @@ class Notifier:
             if is_async:
                 async def async_method(title: str, content: str = "", level: Optional[NotifyLevel] = None, **kwargs):
                     return await self.custom_async(template_name, title, content, level, **kwargs)
-                return async_method
+                method = async_method
             else:
                 def sync_method(title: str, content: str = "", level: Optional[NotifyLevel] = None, **kwargs):
                     return self.custom(template_name, title, content, level, **kwargs)
-                return sync_method
+                method = sync_method
+            
+            # 缓存到实例字典，之后的访问直接命中，不再经过 __getattr__
+            self.__dict__[name] = method
+            self._template_methods.add(name)
+            return method
         
         raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
     
@@ -453,14 +572,21 @@ class Notifier:
     def reload_templates(self):
         """重新加载模板"""
         self._template_loader.reload()
+        
+        # 清除已缓存的模板方法，下次访问时重新解析
+        for name in self._template_methods:
+            self.__dict__.pop(name, None)
+        self._template_methods.clear()
     
     def close(self):
         """关闭资源"""
         self._sender.close()
+        self._template_loader.close()
     
     async def close_async(self):
         """异步关闭资源"""
         await self._sender.close_async()
+        self._template_loader.close()
     
     def __enter__(self):
         return self
@@ -4,20 +4,33 @@
 支持:
 - 级别配置自动加载（颜色、emoji 等）
 - 默认模板 + 自定义模板分离
-- 模板热加载
+- 模板热加载（安装 watchdog 时基于文件系统事件，否则轮询）
 - Jinja2 变量渲染
 """
 
-import json
+import os
+import re
 import threading
-import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set
 
-from jinja2 import Environment, BaseLoader, TemplateNotFound
+from jinja2 import Environment, Template
 
+from ..core import jsonlib
 from ..core.types import NotifyLevel, NotifyMessage
 
+# watchdog 为可选依赖：安装后热加载由文件系统事件驱动，未安装时回退到定时轮询
+try:
+    from watchdog.events import FileSystemEventHandler, PatternMatchingEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = None
+    PatternMatchingEventHandler = None
+    Observer = None
+
 
 # 目录路径
 TEMPLATES_DIR = Path(__file__).parent
@@ -27,17 +40,112 @@ CUSTOM_TEMPLATES_DIR = TEMPLATES_DIR / "custom"
 LEGACY_CARDS_DIR = TEMPLATES_DIR / "cards"
 
 
-class DictLoader(BaseLoader):
-    """从字典加载模板的 Jinja2 Loader"""
+# 共享的 Jinja2 环境（配置与原先每次新建的 Environment 一致）
+_JINJA_ENV = Environment()
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template_str: str) -> Template:
+    """编译模板字符串（按字符串缓存，同一模板只解析一次）"""
+    return _JINJA_ENV.from_string(template_str)
+
+
+# 仅由单个变量组成的模板（如 "{{ error_msg }}"），可直接查上下文，无需 Jinja2 渲染
+_SINGLE_VARIABLE_PATTERN = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+# Jinja2 中有特殊含义的名字（字面量与全局函数），不走快速路径
+_JINJA_RESERVED_NAMES = frozenset(
+    ("true", "false", "none", "True", "False", "None", *_JINJA_ENV.globals)
+)
+_MISSING = object()
+
+
+@lru_cache(maxsize=1024)
+def _compile_string(template_str: str) -> Callable[[Dict[str, Any]], str]:
+    """
+    将模板字符串编译为渲染函数 (context) -> str
+    
+    - 不含变量：原样返回
+    - 单个变量：直接查上下文，结果与 Jinja2 一致（缺失为空字符串，其余为 str(value)）
+    - 其他：Jinja2 渲染，失败时返回原字符串
+    """
+    if "{{" not in template_str:
+        return lambda context: template_str
     
-    def __init__(self, templates: Dict[str, str]):
-        self.templates = templates
+    match = _SINGLE_VARIABLE_PATTERN.fullmatch(template_str)
+    if match and match.group(1) not in _JINJA_RESERVED_NAMES:
+        name = match.group(1)
+        
+        def render_variable(context: Dict[str, Any]) -> str:
+            value = context.get(name, _MISSING)
+            if value is _MISSING:
+                return ""
+            return value if type(value) is str else str(value)
+        
+        return render_variable
+    
+    try:
+        template = _compile_template(template_str)
+    except Exception:
+        return lambda context: template_str
+    
+    def render_template(context: Dict[str, Any]) -> str:
+        try:
+            return template.render(context)
+        except Exception:
+            return template_str
     
-    def get_source(self, environment, template):
-        if template in self.templates:
-            source = self.templates[template]
-            return source, template, lambda: True
-        raise TemplateNotFound(template)
+    return render_template
+
+
+# 卡片 config 固定不变，所有卡片共享同一个对象（只读，请勿修改）
+_CARD_CONFIG: Dict[str, Any] = {
+    "wide_screen_mode": True,
+    "enable_forward": True,
+}
+
+# 模板不存在时返回的只读空模板
+_EMPTY_TEMPLATE: Mapping[str, Any] = MappingProxyType({})
+
+# 默认级别模板名（小写）
+_LEVEL_NAMES = frozenset(level.name.lower() for level in NotifyLevel)
+
+# has_template 最多缓存的不存在模板名数量，超出时清空重建
+_MAX_MISSING_NAMES = 1024
+
+# 渲染结果为这些值时，元素的 condition 视为不成立
+_FALSE_CONDITIONS = ("", "[]", "{}", "None", "False")
+
+
+def _is_false_condition(rendered: str) -> bool:
+    """判断渲染后的 condition 是否不成立"""
+    return not rendered or rendered in _FALSE_CONDITIONS
+
+
+def _read_template_file(path: Path) -> Dict[str, Any]:
+    """
+    读取并解析模板文件（纯 I/O，不访问 loader 状态，无需持锁）
+    
+    Raises:
+        OSError: 文件读取失败
+        ValueError: JSON 解析失败
+    """
+    data = jsonlib.loads(path.read_bytes())
+    data.pop("_comment", None)
+    return data
+
+
+@dataclass
+class _CardPlan:
+    """
+    预编译的卡片骨架
+    
+    加载模板时一次性求值不含 Jinja2 变量的部分（静态 condition、静态文本、
+    静态字段），渲染时只处理依赖上下文的部分
+    """
+    title_template: Optional[str]  # 自定义标题模板，None 使用级别默认标题
+    element_builders: List[Callable[[Dict[str, Any]], Optional[Any]]]
+    footer_note: Optional[str]  # footer 文本（静态时已求值）
+    footer_is_static: bool
 
 
 class TemplateLoader:
@@ -61,11 +169,24 @@ class TemplateLoader:
         self.enable_hot_reload = enable_hot_reload
         self.reload_interval = reload_interval
         
-        self._base_templates: Dict[str, Dict[str, Any]] = {}
-        self._custom_templates: Dict[str, Dict[str, Any]] = {}
+        # 模板以只读映射保存，对外直接返回，无需每次复制
+        self._base_templates: Dict[str, Mapping[str, Any]] = {}
+        self._custom_templates: Dict[str, Mapping[str, Any]] = {}
+        # "base:{name}" / "custom:{name}" -> 预编译的卡片骨架
+        self._card_plans: Dict[str, _CardPlan] = {}
         self._template_mtimes: Dict[str, float] = {}
         self._lock = threading.RLock()
         
+        # has_template 查过文件、确认不存在的模板名（只在热加载监控能覆盖所有模板目录时使用）；
+        # 监控加载到同名模板时移除，_custom_generation 防止与并发加载交错时写入过期结果
+        self._missing_names: Set[str] = set()
+        self._custom_generation = 0
+        self._track_missing = False
+        
+        # 热加载监控（watchdog Observer 或轮询线程的停止信号）
+        self._observer = None
+        self._stop_event = threading.Event()
+        
         # 初始加载
         self._load_all_templates()
         
@@ -74,91 +195,221 @@ class TemplateLoader:
             self._start_reload_watcher()
     
     def _load_all_templates(self):
-        """加载所有模板"""
-        with self._lock:
-            # 加载默认模板
-            for level in NotifyLevel:
-                self._load_base_template(level.name.lower())
-            
-            # 加载自定义模板
-            self._scan_custom_templates()
+        """加载所有模板（逐个加载，锁只在写入结果时持有）"""
+        # 加载默认模板
+        for level in NotifyLevel:
+            self._load_base_template(level.name.lower())
+        
+        # 加载自定义模板
+        self._scan_custom_templates()
     
     def _load_base_template(self, name: str):
         """加载默认模板"""
         template_path = self.base_dir / f"{name}.json"
         
-        if template_path.exists():
-            try:
-                with open(template_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    data.pop("_comment", None)
-                    self._base_templates[name] = data
-                self._template_mtimes[f"base:{name}"] = template_path.stat().st_mtime
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Failed to load base template {name}: {e}")
-    
-    def _scan_custom_templates(self):
-        """扫描并加载所有自定义模板"""
+        # 读取、解析和预编译都在锁外完成，不阻塞渲染和其他模板的重载
+        try:
+            mtime = os.stat(template_path).st_mtime
+        except OSError:
+            return
+        try:
+            data = _read_template_file(template_path)
+        except (ValueError, IOError) as e:
+            print(f"Warning: Failed to load base template {name}: {e}")
+            return
+        plan = self._compile_card(data)
+        
+        with self._lock:
+            self._base_templates[name] = MappingProxyType(data)
+            self._card_plans[f"base:{name}"] = plan
+            self._template_mtimes[f"base:{name}"] = mtime
+    
+    def _scan_custom_templates(self, only_changed: bool = False):
+        """
+        扫描并加载所有自定义模板
+        
+        Args:
+            only_changed: 只加载修改时间晚于上次加载的文件（轮询热加载时使用）
+        """
         # 扫描 custom 目录
-        if self.custom_dir.exists():
-            for template_file in self.custom_dir.glob("*.json"):
-                name = template_file.stem
-                self._load_custom_template(name, template_file)
-        
-        # 兼容旧版本：扫描 cards 目录
-        if LEGACY_CARDS_DIR.exists():
-            for template_file in LEGACY_CARDS_DIR.glob("*.json"):
-                name = template_file.stem
-                # 跳过 6 个默认级别的模板（已迁移到 base/）
-                if name.lower() not in [l.name.lower() for l in NotifyLevel]:
-                    self._load_custom_template(name, template_file)
-    
-    def _load_custom_template(self, name: str, path: Path):
-        """加载单个自定义模板"""
+        self._scan_template_dir(self.custom_dir, only_changed)
+        
+        # 兼容旧版本：扫描 cards 目录（跳过 6 个默认级别的模板，已迁移到 base/）
+        self._scan_template_dir(LEGACY_CARDS_DIR, only_changed, skip_levels=True)
+    
+    def _scan_template_dir(self, directory: Path, only_changed: bool, skip_levels: bool = False):
+        """用 os.scandir 扫描目录下的 *.json 模板，目录项自带 stat 缓存"""
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                data.pop("_comment", None)
-                self._custom_templates[name] = data
-            self._template_mtimes[f"custom:{name}"] = path.stat().st_mtime
-        except (json.JSONDecodeError, IOError) as e:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it if entry.name.endswith(".json")]
+        except OSError:
+            return
+        
+        for entry in entries:
+            name = entry.name[:-5]
+            if skip_levels and name.lower() in _LEVEL_NAMES:
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if only_changed and mtime <= self._template_mtimes.get(f"custom:{name}", 0):
+                continue
+            self._load_custom_template(name, Path(entry.path), mtime)
+    
+    def _load_custom_template(self, name: str, path: Path, mtime: Optional[float] = None):
+        """加载单个自定义模板（mtime 为调用方已获取的修改时间）"""
+        # 文件已存在（即使解析失败），先让 has_template 的缓存失效
+        with self._lock:
+            self._custom_generation += 1
+            self._missing_names.discard(name)
+        try:
+            if mtime is None:
+                mtime = os.stat(path).st_mtime
+            data = _read_template_file(path)
+        except (ValueError, IOError) as e:
             print(f"Warning: Failed to load custom template {name}: {e}")
+            return
+        plan = self._compile_card(data)
+        
+        with self._lock:
+            self._custom_templates[name] = MappingProxyType(data)
+            self._card_plans[f"custom:{name}"] = plan
+            self._template_mtimes[f"custom:{name}"] = mtime
     
     def _start_reload_watcher(self):
-        """启动热重载监控线程"""
+        """启动热重载监控（优先使用 watchdog 事件通知）"""
+        if Observer is not None and self._start_event_watcher():
+            return
+        
         def watcher():
-            while True:
-                time.sleep(self.reload_interval)
+            while not self._stop_event.wait(self.reload_interval):
                 self._check_and_reload()
         
+        # 轮询每次都会扫描整个目录，新文件一定会被加载
+        self._track_missing = True
         thread = threading.Thread(target=watcher, daemon=True)
         thread.start()
     
+    def _start_event_watcher(self) -> bool:
+        """
+        基于 watchdog 监听模板目录，文件创建/修改时只重载对应模板
+        
+        Returns:
+            是否启动成功（失败时调用方回退到轮询）
+        """
+        loader = self
+        
+        class _TemplateEventHandler(PatternMatchingEventHandler):
+            def on_created(self, event):
+                loader._on_template_changed(event.src_path)
+            
+            def on_modified(self, event):
+                loader._on_template_changed(event.src_path)
+            
+            def on_moved(self, event):
+                # 编辑器常以"写临时文件 + 重命名"的方式保存
+                loader._on_template_changed(event.dest_path)
+        
+        # 尚不存在的模板目录：监听其父目录，目录被创建后该目录下的文件不会触发事件
+        missing_dirs = {
+            Path(directory).resolve()
+            for directory in (self.custom_dir, LEGACY_CARDS_DIR)
+            if not directory.is_dir()
+        }
+        
+        class _TemplateDirEventHandler(FileSystemEventHandler):
+            def on_created(self, event):
+                if event.is_directory and Path(event.src_path).resolve() in missing_dirs:
+                    loader._on_template_dir_created()
+            
+            def on_moved(self, event):
+                if event.is_directory and Path(event.dest_path).resolve() in missing_dirs:
+                    loader._on_template_dir_created()
+        
+        handler = _TemplateEventHandler(patterns=["*.json"], ignore_directories=True)
+        dir_handler = _TemplateDirEventHandler()
+        observer = Observer()
+        track_missing = True
+        try:
+            for directory in (self.base_dir, self.custom_dir, LEGACY_CARDS_DIR):
+                if directory.is_dir():
+                    observer.schedule(handler, str(directory), recursive=False)
+            for parent in {directory.parent for directory in missing_dirs}:
+                if parent.is_dir():
+                    observer.schedule(dir_handler, str(parent), recursive=False)
+                else:
+                    track_missing = False
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            print(f"Warning: Failed to start template watcher, falling back to polling: {e}")
+            return False
+        
+        self._observer = observer
+        self._track_missing = track_missing
+        return True
+    
+    def _on_template_dir_created(self):
+        """启动时不存在的模板目录被创建：该目录不在监听范围内，has_template 改为始终检查文件"""
+        with self._lock:
+            self._track_missing = False
+            self._missing_names.clear()
+    
+    def _on_template_changed(self, src_path: str):
+        """处理单个模板文件的变更事件"""
+        path = Path(src_path)
+        name = path.stem
+        # watchdog 上报绝对路径，模板目录可能是相对路径或符号链接，统一解析后再比较
+        parent = path.parent.resolve()
+        is_level = name.lower() in _LEVEL_NAMES
+        
+        if parent == Path(self.base_dir).resolve():
+            if is_level:
+                self._load_base_template(name)
+        elif parent == Path(self.custom_dir).resolve():
+            self._load_custom_template(name, path)
+        elif parent == LEGACY_CARDS_DIR.resolve() and not is_level:
+            # 6 个默认级别的模板已迁移到 base/
+            self._load_custom_template(name, path)
+    
     def _check_and_reload(self):
         """检查文件变更并重载"""
         with self._lock:
-            # 检查默认模板
-            for name in list(self._base_templates.keys()):
-                template_path = self.base_dir / f"{name}.json"
-                if template_path.exists():
-                    current_mtime = template_path.stat().st_mtime
-                    key = f"base:{name}"
-                    if current_mtime > self._template_mtimes.get(key, 0):
-                        self._load_base_template(name)
-            
-            # 检查自定义模板
-            self._scan_custom_templates()
+            base_names = list(self._base_templates.keys())
+        
+        # 检查默认模板
+        for name in base_names:
+            try:
+                current_mtime = os.stat(self.base_dir / f"{name}.json").st_mtime
+            except OSError:
+                continue
+            if current_mtime > self._template_mtimes.get(f"base:{name}", 0):
+                self._load_base_template(name)
+        
+        # 检查自定义模板（只重载有变更的文件）
+        self._scan_custom_templates(only_changed=True)
     
     def has_template(self, name: str) -> bool:
-        """检查模板是否存在"""
+        """
+        检查模板是否存在
+        
+        已加载的模板只查内存；未加载时检查文件。热加载监控运行时，确认不存在的名称
+        记入内存集合，之后直接返回 False，直到监控加载到同名模板文件
+        """
         # 检查是否是默认级别
-        if name.upper() in [l.name for l in NotifyLevel]:
+        if name.upper() in NotifyLevel.__members__:
             return True
         
         # 检查自定义模板
         with self._lock:
             if name in self._custom_templates:
                 return True
+            if name in self._missing_names:
+                return False
+            generation = self._custom_generation
         
         # 检查文件是否存在
         custom_path = self.custom_dir / f"{name}.json"
@@ -172,21 +423,27 @@ class TemplateLoader:
             self._load_custom_template(name, legacy_path)
             return True
         
+        with self._lock:
+            # 检查文件期间有模板被加载时不缓存，避免错过刚创建的文件
+            if self._track_missing and generation == self._custom_generation:
+                if len(self._missing_names) >= _MAX_MISSING_NAMES:
+                    self._missing_names.clear()
+                self._missing_names.add(name)
         return False
     
-    def get_base_template(self, level: NotifyLevel) -> Dict[str, Any]:
-        """获取默认模板"""
+    def get_base_template(self, level: NotifyLevel) -> Mapping[str, Any]:
+        """获取默认模板（只读映射，需要修改时请先 dict() 复制）"""
         name = level.name.lower()
         with self._lock:
-            return self._base_templates.get(name, {}).copy()
+            return self._base_templates.get(name, _EMPTY_TEMPLATE)
     
-    def get_custom_template(self, name: str) -> Optional[Dict[str, Any]]:
-        """获取自定义模板"""
+    def get_custom_template(self, name: str) -> Optional[Mapping[str, Any]]:
+        """获取自定义模板（只读映射，需要修改时请先 dict() 复制）"""
         if not self.has_template(name):
             return None
         
         with self._lock:
-            return self._custom_templates.get(name, {}).copy()
+            return self._custom_templates.get(name, _EMPTY_TEMPLATE)
     
     def get_custom_template_level(self, name: str) -> NotifyLevel:
         """获取自定义模板的默认级别"""
@@ -206,37 +463,54 @@ class TemplateLoader:
         Args:
             message: 消息对象
             template_name: 自定义模板名称，None 则使用级别默认模板
+            
+        Note:
+            返回卡片的 config 为各卡片共享的只读对象
         """
         level = message.level
         context = self._build_context(message)
         
-        # 获取模板
-        if template_name:
-            template = self.get_custom_template(template_name)
-            if not template:
-                template = self.get_base_template(level)
-        else:
-            template = self.get_base_template(level)
+        # 获取模板（自定义模板不存在或为空时使用级别默认模板）
+        plan = self._get_custom_plan(template_name) if template_name else None
+        if plan is None:
+            plan = self._get_base_plan(level)
         
         # 构建卡片
-        return self._build_card(template, context, level)
+        return self._render_plan(plan, context, level)
     
     def render_custom(self, template_name: str, message: NotifyMessage) -> Optional[Dict[str, Any]]:
         """使用自定义模板渲染"""
-        template = self.get_custom_template(template_name)
-        if not template:
+        plan = self._get_custom_plan(template_name)
+        if plan is None:
             return None
         
         context = self._build_context(message)
-        return self._build_card(template, context, message.level)
+        return self._render_plan(plan, context, message.level)
+    
+    def _get_base_plan(self, level: NotifyLevel) -> _CardPlan:
+        """获取级别默认模板的卡片骨架"""
+        with self._lock:
+            plan = self._card_plans.get(f"base:{level.name.lower()}")
+        return plan if plan is not None else self._compile_card({})
+    
+    def _get_custom_plan(self, name: str) -> Optional[_CardPlan]:
+        """获取自定义模板的卡片骨架，模板不存在或为空时返回 None"""
+        if not self.has_template(name):
+            return None
+        
+        with self._lock:
+            if not self._custom_templates.get(name):
+                return None
+            return self._card_plans.get(f"custom:{name}")
     
     def _build_context(self, message: NotifyMessage) -> Dict[str, Any]:
         """构建模板渲染上下文"""
+        level = message.level
         return {
-            "level": message.level.name,
-            "level_color": message.level.color,
-            "level_emoji": message.level.emoji,
-            "level_prefix": message.level.prefix,
+            "level": level.name,
+            "level_color": level.color,
+            "level_emoji": level.emoji,
+            "level_prefix": level.prefix,
             "title": message.title,
             "formatted_title": message.formatted_title,
             "content": message.content or "",
@@ -263,20 +537,160 @@ class TemplateLoader:
         level: NotifyLevel
     ) -> Dict[str, Any]:
         """根据模板构建飞书卡片"""
-        
-        # 获取自定义标题前缀
+        return self._render_plan(self._compile_card(template), context, level)
+    
+    def _compile_card(self, template: Dict[str, Any]) -> _CardPlan:
+        """将模板预编译为卡片骨架"""
         title_prefix = template.get("title_prefix")
-        if title_prefix:
-            title_content = self._render_string(f"{title_prefix} {{{{ title }}}}", context)
+        title_template = f"{title_prefix} {{{{ title }}}}" if title_prefix else None
+        
+        builders = []
+        for element in template.get("elements", []):
+            builder = self._compile_element(element)
+            if builder is not None:
+                builders.append(builder)
+        
+        footer_note = template.get("footer_note") or None
+        footer_is_static = isinstance(footer_note, str) and "{{" not in footer_note
+        
+        return _CardPlan(
+            title_template=title_template,
+            element_builders=builders,
+            footer_note=footer_note,
+            footer_is_static=footer_is_static,
+        )
+    
+    def _compile_element(
+        self, element: Dict[str, Any]
+    ) -> Optional[Callable[[Dict[str, Any]], Optional[Any]]]:
+        """
+        将单个元素预编译为构建函数
+        
+        Returns:
+            构建函数 (context) -> 元素；元素恒为空时返回 None
+        """
+        tag = element.get("tag")
+        condition = element.get("condition")
+        
+        # 静态 condition 在加载时求值：恒不成立则直接丢弃，恒成立则渲染时跳过检查
+        if isinstance(condition, str) and condition and "{{" not in condition:
+            if _is_false_condition(condition):
+                return None
+            condition = None
+        
+        if tag == "markdown":
+            builder = self._compile_markdown(element.get("content", ""))
+        elif tag == "div":
+            builder = self._compile_div(element.get("fields", []))
+        elif tag in ("error_block", "metrics_block", "extra_fields", "actions"):
+            # 完全依赖上下文的元素，保留原有构建逻辑（含 condition 检查）
+            return lambda context: self._build_element(element, context)
         else:
-            title_content = f"{level.emoji} {level.prefix} {context['title']}"
+            # 未知 tag 不产生元素
+            return None
+        
+        if builder is None or not condition:
+            return builder
+        
+        if isinstance(condition, str):
+            render_condition = _compile_string(condition)
+        else:
+            def render_condition(context: Dict[str, Any]) -> str:
+                return self._render_string(condition, context)
+        
+        def build_with_condition(context: Dict[str, Any]) -> Optional[Any]:
+            if _is_false_condition(render_condition(context)):
+                return None
+            return builder(context)
+        
+        return build_with_condition
+    
+    def _compile_markdown(self, content: Any) -> Optional[Callable[[Dict[str, Any]], Optional[Any]]]:
+        """预编译 markdown 元素"""
+        if not isinstance(content, str):
+            return lambda context: self._build_element({"tag": "markdown", "content": content}, context)
+        
+        if "{{" not in content:
+            if not content:
+                return None
+            return lambda context: {"tag": "markdown", "content": content}
+        
+        render_content = _compile_string(content)
+        
+        def build(context: Dict[str, Any]) -> Optional[Any]:
+            rendered = render_content(context)
+            if rendered:
+                return {"tag": "markdown", "content": rendered}
+            return None
+        
+        return build
+    
+    def _compile_div(self, fields: List[Dict[str, Any]]) -> Optional[Callable[[Dict[str, Any]], Optional[Any]]]:
+        """预编译 div 元素：静态字段在加载时拼好内容，动态字段渲染时求值"""
+        # (key, 静态内容, 动态值渲染函数)，二者其一为 None
+        specs = []
+        for field in fields:
+            key = field.get("key", "")
+            value = field.get("value", "")
+            if isinstance(value, str) and "{{" not in value:
+                if value and value != "-":
+                    specs.append((key, f"**{key}**\n{value}", None))
+            elif isinstance(value, str):
+                specs.append((key, None, _compile_string(value)))
+            else:
+                specs.append((key, None, lambda context, value=value: self._render_string(value, context)))
+        
+        if not specs:
+            return None
+        
+        def build(context: Dict[str, Any]) -> Optional[Any]:
+            built_fields = []
+            for key, content, render_value in specs:
+                if render_value is not None:
+                    value = render_value(context)
+                    if not value or value == "-":
+                        continue
+                    content = f"**{key}**\n{value}"
+                built_fields.append({
+                    "is_short": True,
+                    "text": {
+                        "tag": "lark_md",
+                        "content": content,
+                    },
+                })
+            if built_fields:
+                return {"tag": "div", "fields": built_fields}
+            return None
+        
+        return build
+    
+    def _render_plan(
+        self,
+        plan: _CardPlan,
+        context: Dict[str, Any],
+        level: NotifyLevel
+    ) -> Dict[str, Any]:
+        """按预编译的卡片骨架渲染飞书卡片"""
+        
+        # 标题
+        if plan.title_template:
+            title_content = self._render_string(plan.title_template, context)
+        else:
+            title_content = level.title_lead + context['title']
+        
+        # 构建 elements
+        elements = []
+        for build in plan.element_builders:
+            built = build(context)
+            if built:
+                if isinstance(built, list):
+                    elements.extend(built)
+                else:
+                    elements.append(built)
         
         # 构建 header
         card = {
-            "config": {
-                "wide_screen_mode": True,
-                "enable_forward": True,
-            },
+            "config": _CARD_CONFIG,
             "header": {
                 "template": level.color,
                 "title": {
@@ -284,35 +698,28 @@ class TemplateLoader:
                     "content": title_content,
                 },
             },
-            "elements": [],
+            "elements": elements,
         }
         
-        # 构建 elements
-        elements = template.get("elements", [])
-        for element in elements:
-            built = self._build_element(element, context)
-            if built:
-                if isinstance(built, list):
-                    card["elements"].extend(built)
-                else:
-                    card["elements"].append(built)
-        
         # 添加分割线
-        if card["elements"]:
-            card["elements"].append({"tag": "hr"})
+        if elements:
+            elements.append({"tag": "hr"})
         
         # 添加 footer
-        footer_note = template.get("footer_note")
+        footer_note = plan.footer_note
         if footer_note:
-            rendered_note = self._render_string(footer_note, context)
-            card["elements"].append({
+            if plan.footer_is_static:
+                rendered_note = footer_note
+            else:
+                rendered_note = self._render_string(footer_note, context)
+            elements.append({
                 "tag": "note",
                 "elements": [
                     {"tag": "lark_md", "content": f"{rendered_note} | 来自 {context['source']}"}
                 ],
             })
         else:
-            card["elements"].append({
+            elements.append({
                 "tag": "note",
                 "elements": [
                     {"tag": "plain_text", "content": f"来自 {context['source']}"}
@@ -328,8 +735,7 @@ class TemplateLoader:
         # 检查条件
         condition = element.get("condition")
         if condition:
-            rendered = self._render_string(condition, context)
-            if not rendered or rendered in ("", "[]", "{}", "None", "False"):
+            if _is_false_condition(self._render_string(condition, context)):
                 return None
         
         if tag == "markdown":
@@ -409,14 +815,9 @@ class TemplateLoader:
     
     def _render_string(self, template_str: str, context: Dict[str, Any]) -> str:
         """渲染字符串中的 Jinja2 变量"""
-        if "{{" not in template_str:
-            return template_str
-        
-        try:
-            env = Environment(loader=DictLoader({"t": template_str}))
-            return env.get_template("t").render(context)
-        except Exception:
+        if not isinstance(template_str, str) or "{{" not in template_str:
             return template_str
+        return _compile_string(template_str)(context)
     
     def list_templates(self) -> Dict[str, List[str]]:
         """列出所有可用模板"""
@@ -432,7 +833,20 @@ class TemplateLoader:
     
     def reload(self):
         """手动重载所有模板"""
+        with self._lock:
+            self._missing_names.clear()
         self._load_all_templates()
+    
+    def close(self):
+        """停止热重载监控"""
+        with self._lock:
+            self._track_missing = False
+            self._missing_names.clear()
+        self._stop_event.set()
+        observer, self._observer = self._observer, None
+        if observer is not None:
+            observer.stop()
+            observer.join()
 
 
 # 全局默认模板加载器
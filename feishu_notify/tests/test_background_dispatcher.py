@@ -0,0 +1,109 @@
+"""后台发送队列测试（关闭与排空语义）"""
+
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+from feishu_notify.core.sender import BackgroundDispatcher, SendResult
+
+
+class FakeSender:
+    """记录收到的 payload，可选地在 gate 打开前阻塞发送"""
+    
+    def __init__(self, gate: threading.Event = None):
+        self.gate = gate
+        self.sent = []
+        self._lock = threading.Lock()
+    
+    def send_raw(self, payload):
+        if self.gate is not None:
+            self.gate.wait(5)
+        with self._lock:
+            self.sent.append(payload["id"])
+        return SendResult(success=True, message="ok")
+
+
+def test_close_drains_queue():
+    sender = FakeSender()
+    results = []
+    dispatcher = BackgroundDispatcher(sender, max_batch=7, flush_interval=0.01, on_result=results.append)
+    for i in range(50):
+        assert dispatcher.submit({"id": i}) is True
+    dispatcher.close()
+    
+    assert sorted(sender.sent) == list(range(50))
+    assert len(results) == 50
+    assert not dispatcher._thread.is_alive()
+
+
+def test_submit_after_close_is_rejected():
+    dispatcher = BackgroundDispatcher(FakeSender())
+    dispatcher.close()
+    assert dispatcher.submit({"id": 0}) is False
+    dispatcher.close()  # 重复关闭无副作用
+
+
+def test_submit_when_full_is_rejected():
+    gate = threading.Event()
+    dispatcher = BackgroundDispatcher(FakeSender(gate), max_queue=1, max_batch=1, flush_interval=0)
+    try:
+        accepted = [dispatcher.submit({"id": i}) for i in range(5)]
+        assert accepted.count(False) >= 3
+    finally:
+        gate.set()
+        dispatcher.close()
+
+
+def test_accepted_payloads_survive_concurrent_close():
+    sender = FakeSender()
+    dispatcher = BackgroundDispatcher(sender, max_queue=10000, flush_interval=0)
+    accepted = []
+    start = threading.Event()
+    
+    def produce(offset):
+        start.wait()
+        for i in range(offset, offset + 500):
+            if dispatcher.submit({"id": i}):
+                accepted.append(i)
+    
+    producers = [threading.Thread(target=produce, args=(n * 1000,)) for n in range(4)]
+    for thread in producers:
+        thread.start()
+    start.set()
+    dispatcher.close()
+    for thread in producers:
+        thread.join()
+    
+    assert sorted(sender.sent) == sorted(accepted)
+
+
+def test_unclosed_dispatcher_is_flushed_at_exit():
+    script = textwrap.dedent(
+        """
+        import threading
+        from feishu_notify.core.sender import BackgroundDispatcher, SendResult
+        
+        class Sender:
+            def send_raw(self, payload):
+                threading.Event().wait(0.01)
+                print("sent", payload["id"], flush=True)
+                return SendResult(success=True, message="ok")
+        
+        dispatcher = BackgroundDispatcher(Sender(), max_batch=5, concurrency=2)
+        for i in range(20):
+            dispatcher.submit({"id": i})
+        """
+    )
+    root = Path(__file__).resolve().parents[2]
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    ).stdout
+    
+    assert sorted(int(line.split()[1]) for line in output.splitlines()) == list(range(20))
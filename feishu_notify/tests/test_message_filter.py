@@ -0,0 +1,62 @@
+"""消息过滤器测试（去重占用与限流配额的获取/释放）"""
+
+from feishu_notify.core.dedup import DedupManager, MessageFilter, RateLimiter
+from feishu_notify.core.types import NotifyLevel, NotifyMessage
+
+
+def _filter(max_count: int = 10) -> MessageFilter:
+    return MessageFilter(
+        dedup_manager=DedupManager(enable_auto_cleanup=False),
+        rate_limiter=RateLimiter(max_count=max_count, enable_auto_cleanup=False),
+    )
+
+
+def _message(content: str = "c") -> NotifyMessage:
+    return NotifyMessage(level=NotifyLevel.INFO, title="t", content=content, source="test")
+
+
+def test_acquire_claims_duplicate_once():
+    message_filter = _filter()
+    assert message_filter.acquire(_message())[0] is True
+    assert message_filter.acquire(_message())[0] is False
+
+
+def test_release_frees_dedup_claim_and_rate_quota():
+    message_filter = _filter(max_count=1)
+    message = _message()
+    
+    assert message_filter.acquire(message)[0] is True
+    assert message_filter.acquire(_message("other"))[0] is False
+    
+    message_filter.release(message)
+    assert message_filter.rate_limiter.get_remaining(message) == 1
+    assert message_filter.acquire(message)[0] is True
+
+
+def test_rate_limited_acquire_does_not_keep_dedup_claim():
+    message_filter = _filter(max_count=1)
+    assert message_filter.acquire(_message("a"))[0] is True
+    
+    allowed, reason = message_filter.acquire(_message("b"))
+    assert allowed is False
+    assert "限流" in reason
+    assert message_filter.dedup_manager.is_duplicate(_message("b")) == (False, None)
+
+
+def test_mark_sent_after_acquire_does_not_count_twice():
+    message_filter = _filter(max_count=2)
+    message = _message()
+    
+    message_filter.acquire(message)
+    message_filter.mark_sent(message, claimed=True)
+    assert message_filter.rate_limiter.get_remaining(message) == 1
+    assert message_filter.dedup_manager.is_duplicate(message)[1].count == 1
+
+
+def test_mark_sent_unclaimed_records_both():
+    message_filter = _filter(max_count=2)
+    message = _message()
+    
+    message_filter.mark_sent(message)
+    assert message_filter.rate_limiter.get_remaining(message) == 1
+    assert message_filter.dedup_manager.is_duplicate(message)[0] is True
@@ -0,0 +1,187 @@
+"""限流器测试"""
+
+import asyncio
+
+import pytest
+
+from feishu_notify.core import dedup
+from feishu_notify.core.dedup import AsyncRateLimiter, RateLimiter, RedisRateLimiter
+from feishu_notify.core.types import NotifyLevel, NotifyMessage
+
+
+class FakeClock:
+    """可手动推进的 monotonic_ns"""
+    
+    def __init__(self):
+        self.now = 1_000_000_000_000
+    
+    def __call__(self) -> int:
+        return self.now
+    
+    def advance(self, seconds: float) -> None:
+        self.now += int(seconds * 1_000_000_000)
+
+
+class FakeRedis:
+    """只实现 RedisRateLimiter 用到的命令，Lua 脚本按脚本内容用 Python 模拟（忽略过期）"""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+    
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [key for key in self.data if key.startswith(prefix)]
+    
+    def register_script(self, script):
+        def run(keys, args=()):
+            key = keys[0]
+            count = int(self.data.get(key, 0))
+            if script == RedisRateLimiter._INCR_SCRIPT:
+                self.data[key] = count + 1
+                return count + 1
+            if script == RedisRateLimiter._ACQUIRE_SCRIPT:
+                if count + 1 > int(args[1]):
+                    self.data[key] = count
+                    return [0, count]
+                self.data[key] = count + 1
+                return [1, count]
+            if script == RedisRateLimiter._RELEASE_SCRIPT:
+                if count > 0:
+                    self.data[key] = count - 1
+                    return count - 1
+                return 0
+            raise AssertionError("unexpected script")
+        return run
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(dedup.time, "monotonic_ns", fake)
+    return fake
+
+
+def _message(level: NotifyLevel = NotifyLevel.INFO) -> NotifyMessage:
+    return NotifyMessage(level=level, title="t", content="c", source="test")
+
+
+def test_blocks_after_max_count(clock):
+    limiter = RateLimiter(window_seconds=60, max_count=2, enable_auto_cleanup=False)
+    message = _message()
+    
+    for expected_count in (0, 1):
+        assert limiter.is_allowed(message) == (True, expected_count)
+        limiter.record(message)
+    
+    assert limiter.is_allowed(message) == (False, 2)
+    assert limiter.get_remaining(message) == 0
+
+
+def test_window_expiry_frees_quota(clock):
+    limiter = RateLimiter(window_seconds=60, max_count=1, enable_auto_cleanup=False)
+    message = _message()
+    limiter.record(message)
+    assert limiter.is_allowed(message)[0] is False
+    
+    clock.advance(61)
+    assert limiter.is_allowed(message) == (True, 0)
+
+
+def test_max_count_zero_blocks_everything(clock):
+    limiter = RateLimiter(window_seconds=60, max_count=0, enable_auto_cleanup=False)
+    message = _message()
+    
+    for _ in range(3):
+        assert limiter.is_allowed(message) == (False, 0)
+    limiter.record(message)
+    assert limiter.is_allowed(message)[0] is False
+
+
+def test_exempt_levels_are_not_limited(clock):
+    limiter = RateLimiter(window_seconds=60, max_count=0, enable_auto_cleanup=False)
+    assert limiter.is_allowed(_message(NotifyLevel.CRITICAL)) == (True, 0)
+    assert limiter.is_allowed(_message(NotifyLevel.ERROR)) == (True, 0)
+
+
+def test_async_limiter_blocks_after_max_count(clock):
+    async def run():
+        limiter = AsyncRateLimiter(window_seconds=60, max_count=2, enable_auto_cleanup=False)
+        message = _message()
+        results = []
+        for _ in range(3):
+            allowed, _ = await limiter.is_allowed(message)
+            results.append(allowed)
+            if allowed:
+                await limiter.record(message)
+        return results
+    
+    assert asyncio.run(run()) == [True, True, False]
+
+
+def test_async_limiter_max_count_zero_blocks_everything(clock):
+    async def run():
+        limiter = AsyncRateLimiter(window_seconds=60, max_count=0, enable_auto_cleanup=False)
+        message = _message()
+        return [await limiter.is_allowed(message) for _ in range(3)]
+    
+    assert asyncio.run(run()) == [(False, 0)] * 3
+
+
+def test_acquire_counts_atomically_and_release_returns_quota(clock):
+    limiter = RateLimiter(window_seconds=60, max_count=2, enable_auto_cleanup=False)
+    message = _message()
+    
+    assert limiter.acquire(message) == (True, 0)
+    assert limiter.acquire(message) == (True, 1)
+    assert limiter.acquire(message) == (False, 2)
+    
+    limiter.release(message)
+    assert limiter.acquire(message) == (True, 1)
+
+
+def test_acquire_max_count_zero_and_exempt_levels(clock):
+    limiter = RateLimiter(window_seconds=60, max_count=0, enable_auto_cleanup=False)
+    assert limiter.acquire(_message()) == (False, 0)
+    assert limiter.acquire(_message(NotifyLevel.CRITICAL)) == (True, 0)
+    limiter.release(_message(NotifyLevel.CRITICAL))
+    limiter.release(_message())
+    assert limiter.get_remaining(_message()) == 0
+
+
+def test_redis_acquire_rejects_over_quota_without_counting():
+    client = FakeRedis()
+    limiter = RedisRateLimiter(window_seconds=60, max_count=2, client=client)
+    message = _message()
+    
+    assert limiter.acquire(message) == (True, 0)
+    assert limiter.acquire(message) == (True, 1)
+    assert limiter.acquire(message) == (False, 2)
+    assert limiter.is_allowed(message) == (False, 2)
+    
+    limiter.release(message)
+    assert limiter.get_remaining(message) == 1
+    assert limiter.acquire(message) == (True, 1)
+
+
+def test_redis_release_never_goes_negative():
+    client = FakeRedis()
+    limiter = RedisRateLimiter(window_seconds=60, max_count=1, client=client)
+    message = _message()
+    
+    limiter.release(message)
+    assert client.data == {}
+    assert limiter.acquire(message) == (True, 0)
+    assert limiter.acquire(message) == (False, 1)
+
+
+def test_redis_max_count_zero_blocks_everything():
+    limiter = RedisRateLimiter(window_seconds=60, max_count=0, client=FakeRedis())
+    assert limiter.acquire(_message()) == (False, 0)
+    assert limiter.is_allowed(_message()) == (False, 0)
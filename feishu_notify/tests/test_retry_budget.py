@@ -0,0 +1,63 @@
+"""重试预算测试"""
+
+import pytest
+
+from feishu_notify.core import sender
+from feishu_notify.core.sender import _RetryBudget
+
+
+class FakeClock:
+    """可手动推进的 monotonic"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(sender.time, "monotonic", fake)
+    return fake
+
+
+def _exhaust(budget: _RetryBudget) -> int:
+    acquired = 0
+    while budget.try_acquire():
+        acquired += 1
+    return acquired
+
+
+def test_budget_exhausts_at_capacity(clock):
+    budget = _RetryBudget(capacity=5, min_per_second=1.0)
+    assert _exhaust(budget) == 5
+    assert budget.try_acquire() is False
+
+
+def test_budget_recovers_over_time_without_successes(clock):
+    budget = _RetryBudget(capacity=5, min_per_second=2.0)
+    _exhaust(budget)
+    
+    clock.advance(0.4)
+    assert budget.try_acquire() is False
+    clock.advance(0.2)
+    assert budget.try_acquire() is True
+    assert budget.try_acquire() is False
+    
+    clock.advance(3600)
+    assert _exhaust(budget) == 5
+
+
+def test_successes_refill_budget(clock):
+    budget = _RetryBudget(ratio=0.5, capacity=5, min_per_second=0.0)
+    _exhaust(budget)
+    
+    budget.deposit()
+    assert budget.try_acquire() is False
+    budget.deposit()
+    assert budget.try_acquire() is True
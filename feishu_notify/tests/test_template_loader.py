@@ -0,0 +1,119 @@
+"""模板加载器测试（has_template 的不存在名称缓存）"""
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from feishu_notify.templates import loader as loader_module
+from feishu_notify.templates.loader import TemplateLoader
+
+_TEMPLATE = {"header": {"title": "{{ title }}"}, "elements": []}
+
+
+@pytest.fixture
+def stat_calls(monkeypatch):
+    calls = []
+    original = Path.exists
+    
+    def exists(self, *args, **kwargs):
+        calls.append(self.name)
+        return original(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Path, "exists", exists)
+    return calls
+
+
+@pytest.fixture
+def make_loader(tmp_path):
+    loaders = []
+    
+    def make(**kwargs):
+        kwargs.setdefault("reload_interval", 3600)
+        template_loader = TemplateLoader(template_dir=tmp_path, **kwargs)
+        loaders.append(template_loader)
+        return template_loader
+    
+    yield make
+    for template_loader in loaders:
+        template_loader.close()
+
+
+def _write(directory: Path, name: str) -> Path:
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps(_TEMPLATE), encoding="utf-8")
+    return path
+
+
+def test_miss_is_cached_while_watcher_runs(make_loader, stat_calls):
+    template_loader = make_loader(enable_hot_reload=True)
+    
+    assert template_loader.has_template("nope") is False
+    probes = len(stat_calls)
+    assert template_loader.has_template("nope") is False
+    assert len(stat_calls) == probes
+
+
+def test_watcher_load_invalidates_cached_miss(make_loader, tmp_path):
+    template_loader = make_loader(enable_hot_reload=True)
+    assert template_loader.has_template("late") is False
+    
+    path = _write(tmp_path, "late")
+    template_loader._on_template_changed(str(path))
+    assert template_loader.has_template("late") is True
+
+
+def test_polling_scan_invalidates_cached_miss(make_loader, tmp_path, monkeypatch):
+    monkeypatch.setattr(loader_module, "Observer", None)
+    template_loader = make_loader(enable_hot_reload=True)
+    assert template_loader.has_template("late") is False
+    
+    _write(tmp_path, "late")
+    template_loader._check_and_reload()
+    assert template_loader.has_template("late") is True
+
+
+def test_miss_not_cached_when_load_races_probe(make_loader, tmp_path, monkeypatch):
+    template_loader = make_loader(enable_hot_reload=True)
+    path = tmp_path / "late.json"
+    original = Path.exists
+    
+    def exists(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        if self == path and not result:
+            # 检查文件之后、写入缓存之前，监控加载了新文件
+            _write(tmp_path, "late")
+            template_loader._on_template_changed(str(path))
+        return result
+    
+    monkeypatch.setattr(Path, "exists", exists)
+    assert template_loader.has_template("late") is False
+    monkeypatch.setattr(Path, "exists", original)
+    assert template_loader.has_template("late") is True
+
+
+def test_without_hot_reload_misses_are_rechecked(make_loader, tmp_path):
+    template_loader = make_loader(enable_hot_reload=False)
+    assert template_loader.has_template("late") is False
+    
+    _write(tmp_path, "late")
+    assert template_loader.has_template("late") is True
+
+
+def test_missing_template_dir_created_disables_cache(tmp_path):
+    custom_dir = tmp_path / "custom"
+    template_loader = TemplateLoader(template_dir=custom_dir, reload_interval=3600)
+    try:
+        assert template_loader.has_template("late") is False
+        
+        # 启动时不存在的目录被创建后，其中的文件不会触发事件，不能再缓存不存在的名称
+        custom_dir.mkdir()
+        deadline = time.monotonic() + 5
+        while template_loader._track_missing and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        _write(custom_dir, "late")
+        assert template_loader.has_template("late") is True
+    finally:
+        template_loader.close()
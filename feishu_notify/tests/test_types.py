@@ -0,0 +1,35 @@
+"""消息类型测试"""
+
+from feishu_notify.core.types import NotifyLevel, NotifyMessage
+
+
+def _message() -> NotifyMessage:
+    return NotifyMessage(level=NotifyLevel.INFO, title="t", content="c")
+
+
+def test_add_mention_chains_and_dedups():
+    m = _message()
+    assert m.add_mention("u1").add_mention("u2").add_mention("u1") is m
+    assert m.mentions == ["u1", "u2"]
+
+
+def test_add_mention_after_mentions_reassigned():
+    m = _message()
+    m.add_mention("u1")
+    m.mentions = ["u2"]
+    m.add_mention("u1")
+    assert m.mentions == ["u2", "u1"]
+
+
+def test_add_mention_after_in_place_edit():
+    m = _message()
+    m.add_mention("u1").add_mention("u2")
+    m.mentions.remove("u1")
+    m.add_mention("u1")
+    assert m.mentions == ["u2", "u1"]
+
+
+def test_add_mention_with_existing_duplicates():
+    m = NotifyMessage(level=NotifyLevel.INFO, title="t", content="c", mentions=["u1", "u1"])
+    m.add_mention("u1").add_mention("u2")
+    assert m.mentions == ["u1", "u1", "u2"]
@@ -28,6 +28,8 @@ Usage:
     ''')
 """
 
+import importlib
+
 from .models.level import AlertLevel
 from .models.result import ProbeResult, RowDetail
 from .models.exceptions import (
@@ -37,8 +39,23 @@ from .models.exceptions import (
     SQLValidationError,
 )
 from .notifier import SQLProbeNotifier
-from .core.template import TemplateEngine
-from .core.aggregation import AggregationCondition, MultiCondition
+
+# 高级功能按需导入（PEP 562），只使用 SQLProbeNotifier 时不加载
+_LAZY_IMPORTS = {
+    "TemplateEngine": ".core.template",
+    "AggregationCondition": ".core.aggregation",
+    "MultiCondition": ".core.aggregation",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __version__ = "0.1.0"
 
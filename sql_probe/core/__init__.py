@@ -4,16 +4,30 @@ SQL-Probe 核心组件
 包含 SQL 执行器、级别解析器、结果聚合器、模板引擎、聚合条件
 """
 
+import importlib
+
 from .executor import SQLExecutor
 from .resolver import LevelResolver
 from .aggregator import ResultAggregator
-from .template import TemplateEngine
-from .aggregation import (
-    AggregationType,
-    Operator,
-    AggregationCondition,
-    MultiCondition,
-)
+
+# 模板引擎、聚合条件按需导入（PEP 562）
+_LAZY_IMPORTS = {
+    "TemplateEngine": ".template",
+    "AggregationType": ".aggregation",
+    "Operator": ".aggregation",
+    "AggregationCondition": ".aggregation",
+    "MultiCondition": ".aggregation",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "SQLExecutor",
@@ -4,6 +4,7 @@
 支持对 SQL 结果进行聚合后判断告警条件
 """
 
+import math
 from typing import Any, Dict, List, Optional, Callable
 from enum import Enum
 
@@ -74,11 +75,16 @@ class AggregationCondition:
             return False, 0, "无数据"
         
         # 提取列值
+        column_lower = self.column.lower()
+        column_key = None
         values = []
         for row in rows:
-            # 不区分大小写查找列
-            row_lower = {k.lower(): v for k, v in row.items()}
-            val = row_lower.get(self.column.lower())
+            # 不区分大小写查找列：同一结果集各行列名一致，解析一次实际键名后直接复用
+            if column_key is None or column_key not in row:
+                column_key = next((k for k in row if k.lower() == column_lower), None)
+                if column_key is None:
+                    continue
+            val = row[column_key]
             if val is not None:
                 try:
                     values.append(float(val))
@@ -100,10 +106,11 @@ class AggregationCondition:
     
     def _aggregate(self, values: List[float]) -> float:
         """计算聚合值"""
+        # 求和使用 math.fsum：单次遍历、无精度累积误差，大结果集下 AVG 更稳定
         if self.aggregation == AggregationType.SUM:
-            return sum(values)
+            return math.fsum(values)
         elif self.aggregation == AggregationType.AVG:
-            return sum(values) / len(values)
+            return math.fsum(values) / len(values)
         elif self.aggregation == AggregationType.MAX:
             return max(values)
         elif self.aggregation == AggregationType.MIN:
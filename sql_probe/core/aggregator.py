@@ -42,8 +42,9 @@ class ResultAggregator:
         Returns:
             聚合后的 ProbeResult
         """
-        # 判断是否触发告警
-        triggered = any(d.is_warning for d in details)
+        # 判断是否触发告警（告警行只筛选一次，同时用于内容聚合）
+        warning_details = [d for d in details if d.is_warning]
+        triggered = bool(warning_details)
         
         # 获取告警名称（优先用参数传入的，其次用 SQL 结果中的第一个）
         alert_name = default_alert_name
@@ -52,7 +53,7 @@ class ResultAggregator:
         alert_name = alert_name or "未命名告警"
         
         # 聚合告警内容
-        content = self._aggregate_content(details)
+        content = self._aggregate_content(details, warning_details)
         
         return ProbeResult(
             level=level,
@@ -67,17 +68,23 @@ class ResultAggregator:
             success=True
         )
     
-    def _aggregate_content(self, details: List[RowDetail]) -> str:
+    def _aggregate_content(
+        self,
+        details: List[RowDetail],
+        warning_details: Optional[List[RowDetail]] = None
+    ) -> str:
         """
         聚合告警内容
         
         Args:
             details: 各行的 RowDetail 列表
+            warning_details: 已筛选出的告警行（可选，避免重复筛选）
             
         Returns:
             聚合后的内容字符串
         """
-        warning_details = [d for d in details if d.is_warning]
+        if warning_details is None:
+            warning_details = [d for d in details if d.is_warning]
         
         if not warning_details:
             return "所有检查项正常"
@@ -118,19 +125,22 @@ class ResultAggregator:
                 execution_time=0
             )
         
-        # 合并所有详情
+        # 单次遍历: 合并详情、累计耗时、取最高级别、筛选触发项
         all_details = []
         total_time = 0.0
+        highest_level = results[0].level
+        triggered_results = []
         for r in results:
             all_details.extend(r.details)
             total_time += r.execution_time
-        
-        # 取最高级别
-        highest_level = max(r.level for r in results)
-        triggered = any(r.triggered for r in results)
+            if r.level > highest_level:
+                highest_level = r.level
+            if r.triggered:
+                triggered_results.append(r)
+        triggered = bool(triggered_results)
         
         # 聚合内容
-        content = self._aggregate_batch_content(results)
+        content = self._aggregate_batch_content(results, triggered_results)
         
         return ProbeResult(
             level=highest_level,
@@ -143,17 +153,23 @@ class ResultAggregator:
             executed_at=datetime.now()
         )
     
-    def _aggregate_batch_content(self, results: List[ProbeResult]) -> str:
+    def _aggregate_batch_content(
+        self,
+        results: List[ProbeResult],
+        triggered_results: Optional[List[ProbeResult]] = None
+    ) -> str:
         """
         聚合批量结果的内容
         
         Args:
             results: 多个 ProbeResult 列表
+            triggered_results: 已筛选出的触发项（可选，避免重复筛选）
             
         Returns:
             聚合后的内容字符串
         """
-        triggered_results = [r for r in results if r.triggered]
+        if triggered_results is None:
+            triggered_results = [r for r in results if r.triggered]
         
         if not triggered_results:
             return f"全部 {len(results)} 项检查通过"
@@ -71,7 +71,7 @@ class SQLExecutor:
         
         try:
             # 执行 SQL
-            logger.debug(f"执行 SQL: {sql[:200]}...")
+            logger.debug("执行 SQL: %.200s...", sql)
             df = self.spark.sql(sql)
             
             # 验证列（除非跳过验证）
@@ -5,9 +5,54 @@
 """
 
 import re
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 from datetime import datetime
 
+from ..models.level import AlertLevel
+
+
+# {variable} 占位符
+_VARIABLE_PATTERN = re.compile(r'\{(\w+)\}')
+
+# 级别 -> emoji（预先计算，避免每次渲染访问 AlertLevel.emoji 属性时重建映射）
+_LEVEL_EMOJI: Dict[AlertLevel, str] = {level: level.emoji for level in AlertLevel}
+
+
+class _SafeDict(dict):
+    """format_map 用的变量字典，未知变量原样保留为 {key}"""
+    
+    def __missing__(self, key: str) -> str:
+        return '{' + key + '}'
+
+
+@lru_cache(maxsize=32)
+def _compile_template(template: str) -> Tuple[FrozenSet[str], bool, Tuple[str, ...]]:
+    """
+    编译模板（按模板字符串缓存，预设模板只在首次使用时扫描一次）
+    
+    Returns:
+        (引用的变量名集合, 是否可直接用 str.format_map 渲染, 切分后的片段)
+        片段按 字面量/变量名 交替排列，偶数下标为字面量，奇数下标为变量名
+    """
+    chunks = tuple(_VARIABLE_PATTERN.split(template))
+    names = frozenset(chunks[1::2])
+    # 去掉 {variable} 后仍有花括号、或变量名以数字开头（会被当作位置参数）时，
+    # format_map 的语义与正则替换不同，只能逐段拼接
+    literal = ''.join(chunks[0::2])
+    formattable = (
+        '{' not in literal and '}' not in literal
+        and not any(name[0].isdigit() for name in names)
+    )
+    return names, formattable, chunks
+
+
+def _format_timestamp(dt: datetime) -> str:
+    """格式化为 YYYY-MM-DD HH:MM:SS（naive 时间走 isoformat，比 strftime 快约 3 倍）"""
+    if dt.tzinfo is None:
+        return dt.isoformat(" ", "seconds")
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
 
 class TemplateEngine:
     """
@@ -61,8 +106,25 @@ class TemplateEngine:
 ### 详细信息
 {details}"""
 
+    # 变量名 -> 取值函数
+    _VARIABLE_GETTERS = {
+        'alert_name': lambda self, r: r.alert_name,
+        'level': lambda self, r: r.level.name,
+        'level_emoji': lambda self, r: _LEVEL_EMOJI.get(r.level, '📊'),
+        'content': lambda self, r: r.content,
+        'row_count': lambda self, r: r.row_count,
+        'warning_count': lambda self, r: sum(1 for d in r.details if d.is_warning),
+        'execution_time': lambda self, r: f"{r.execution_time:.2f}",
+        'timestamp': lambda self, r: _format_timestamp(r.executed_at),
+        'triggered': lambda self, r: "是" if r.triggered else "否",
+        'value': lambda self, r: self._get_value(r),
+        'details': lambda self, r: self._get_details(r),
+        'success': lambda self, r: "成功" if r.success else "失败",
+        'error_message': lambda self, r: r.error_message or "",
+    }
+
     def __init__(self):
-        self._pattern = re.compile(r'\{(\w+)\}')
+        self._pattern = _VARIABLE_PATTERN
     
     def render(
         self,
@@ -80,52 +142,62 @@ class TemplateEngine:
             
         Returns:
             渲染后的字符串
+            
+        Note:
+            模板中除 {variable} 外不含其他花括号时，使用 C 实现的
+            str.format_map 渲染；含字面量花括号（如 JSON 片段）的模板
+            按预先切分的片段逐段拼接，渲染结果两者一致
         """
-        # 构建变量字典
-        variables = self._build_variables(result)
+        names, formattable, chunks = _compile_template(template)
+        
+        # 构建变量字典（只计算模板实际引用的变量）
+        variables = self._build_variables(result, names)
         
         # 合并额外变量
         if extra_vars:
             variables.update(extra_vars)
         
-        # 替换变量
-        def replace(match):
-            key = match.group(1)
-            return str(variables.get(key, f'{{{key}}}'))
+        if formattable:
+            return template.format_map(_SafeDict((k, str(v)) for k, v in variables.items()))
         
-        return self._pattern.sub(replace, template)
+        # 逐段拼接：偶数下标为字面量，奇数下标为变量名
+        return ''.join(
+            chunk if i % 2 == 0 else str(variables.get(chunk, '{' + chunk + '}'))
+            for i, chunk in enumerate(chunks)
+        )
     
-    def _build_variables(self, result: Any) -> Dict[str, Any]:
+    def _build_variables(
+        self,
+        result: Any,
+        needed: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, Any]:
         """
         从 ProbeResult 构建变量字典
-        """
-        # 获取第一行的值（用于简单场景）
-        value = ""
-        if result.details:
-            first_detail = result.details[0]
-            value = first_detail.alert_info
-        
-        # 格式化详细信息
-        details_text = self._format_details(result.details) if result.details else "无"
         
-        # 级别 emoji
-        level_emoji = getattr(result.level, 'emoji', '📊')
+        Args:
+            result: ProbeResult 对象
+            needed: 需要的变量名集合，None 表示构建全部变量
+        """
+        getters = self._VARIABLE_GETTERS
+        if needed is None:
+            needed = getters.keys()
         
-        return {
-            'alert_name': result.alert_name,
-            'level': result.level.name,
-            'level_emoji': level_emoji,
-            'content': result.content,
-            'row_count': result.row_count,
-            'warning_count': len(result.warning_rows),
-            'execution_time': f"{result.execution_time:.2f}",
-            'timestamp': result.executed_at.strftime("%Y-%m-%d %H:%M:%S"),
-            'triggered': "是" if result.triggered else "否",
-            'value': value,
-            'details': details_text,
-            'success': "成功" if result.success else "失败",
-            'error_message': result.error_message or "",
-        }
+        variables = {}
+        for name in needed:
+            getter = getters.get(name)
+            if getter is not None:
+                variables[name] = getter(self, result)
+        return variables
+    
+    def _get_value(self, result: Any) -> str:
+        """获取第一行的值（用于简单场景）"""
+        if result.details:
+            return result.details[0].alert_info
+        return ""
+    
+    def _get_details(self, result: Any) -> str:
+        """格式化详细信息（遍历所有行，仅在模板引用 {details} 时计算）"""
+        return self._format_details(result.details) if result.details else "无"
     
     def _format_details(self, details: list) -> str:
         """格式化详细信息列表"""
@@ -4,6 +4,7 @@
 定义 ProbeResult 和 RowDetail 数据类
 """
 
+import sys
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -11,12 +12,17 @@ from typing import Any, Dict, List, Optional
 from .level import AlertLevel
 
 
-@dataclass
+# Python 3.10+ 支持 dataclass(slots=True)，旧版本退化为普通 dataclass
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class RowDetail:
     """
     单行结果详情
     
     存储 SQL 返回的每一行数据及其解析后的级别
+    使用 __slots__（Python 3.10+），每行不再携带实例 __dict__
     """
     alert_name: str
     is_warning: bool
@@ -16,7 +16,8 @@ Webhook 配置（支持多个飞书群）:
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from .models.level import AlertLevel
 from .models.result import ProbeResult
@@ -29,8 +30,10 @@ from .models.exceptions import (
 from .core.executor import SQLExecutor
 from .core.resolver import LevelResolver
 from .core.aggregator import ResultAggregator
-from .core.template import TemplateEngine
-from .core.aggregation import AggregationCondition, MultiCondition
+
+if TYPE_CHECKING:
+    # 仅用于类型标注，运行时按需由调用方导入
+    from .core.aggregation import AggregationCondition, MultiCondition
 
 logger = logging.getLogger(__name__)
 
@@ -113,6 +116,8 @@ class SQLProbeNotifier:
         self.executor = SQLExecutor(spark)
         self.resolver = LevelResolver()
         self.aggregator = ResultAggregator()
+        # 模板引擎在创建实例时才导入，import sql_probe 时不加载
+        from .core.template import TemplateEngine
         self.template_engine = TemplateEngine()
         
         # 告警状态历史（用于 notify_on_ok 功能）
@@ -250,7 +255,7 @@ class SQLProbeNotifier:
         notify_on_ok: bool = False,
         empty_result_as: str = "ok",
         template: Optional[str] = None,
-        condition: Optional[Union[AggregationCondition, MultiCondition]] = None,
+        condition: Optional[Union["AggregationCondition", "MultiCondition"]] = None,
     ) -> ProbeResult:
         """
         执行 SQL 探针检查
@@ -501,7 +506,7 @@ class SQLProbeNotifier:
                 content = self.template_engine.render(template, result)
             else:
                 content = self.template_engine.render(
-                    TemplateEngine.DEFAULT_TEMPLATE, 
+                    self.template_engine.DEFAULT_TEMPLATE, 
                     result
                 )
             
@@ -573,7 +578,6 @@ class SQLProbeNotifier:
         if self.debug:
             logger.debug(f"[SQL-Probe] 空结果处理: {empty_result_as} -> {level.name}")
         
-        from datetime import datetime
         return ProbeResult(
             level=level,
             triggered=triggered,
@@ -666,7 +670,7 @@ class SQLProbeNotifier:
     def _evaluate_condition(
         self,
         rows: List[Dict[str, Any]],
-        condition: Union[AggregationCondition, MultiCondition],
+        condition: Union["AggregationCondition", "MultiCondition"],
         execution_time: float,
         sql_text: str,
         alert_name: Optional[str]
@@ -681,8 +685,6 @@ class SQLProbeNotifier:
             sql_text: SQL 文本
             alert_name: 告警名称
         """
-        from datetime import datetime
-        
         triggered, value, message = condition.evaluate(rows)
         level = AlertLevel.WARNING if triggered else AlertLevel.INFO
         